@@ -0,0 +1,305 @@
+"""여러 반 설문을 한꺼번에 분석하기 (Streamlit 없이)
+
+폴더 안의 CSV/XLSX 파일이나 목록 파일(manifest)에 적힌 반들을 여러 프로세스로 나눠
+분석하고, 반마다 보고서와 자리 배치표를 저장해요. 끝난 반은 상태 파일을 남기므로
+중간에 멈춰도 다시 실행하면 남은 반부터 이어서 해요.
+
+    python batch_runner.py 설문폴더 --output 결과폴더
+    python batch_runner.py manifest.csv --output 결과폴더 --workers 8
+
+manifest.csv 는 path 열(필수)과 name, rows, cols 열(선택)을 가진 CSV예요.
+path가 상대 경로면 manifest 파일이 있는 폴더 기준이에요.
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from friendship_analyzer import FriendshipAnalyzer
+from seating_optimizer import SeatingOptimizer
+from report_builder import (
+    create_text_report, create_csv_report, create_markdown_report, create_html_report,
+    create_seating_csv, create_seating_text, create_seating_html
+)
+
+SURVEY_EXTENSIONS = ('.csv', '.xlsx')
+STATUS_FILE = '_status.json'
+DEFAULT_COLS = 6
+
+# 형식 이름: (파일 이름, 만드는 함수)
+REPORT_FORMATS = {
+    'txt': ('report.txt', create_text_report),
+    'csv': ('report.csv', create_csv_report),
+    'md': ('report.md', create_markdown_report),
+    'html': ('report.html', create_html_report),
+}
+SEATING_FORMATS = {
+    'csv': ('seating.csv', create_seating_csv),
+    'txt': ('seating.txt', create_seating_text),
+    'html': ('seating.html', create_seating_html),
+}
+SEATING_METHODS = ('genetic', 'greedy', 'annealing')
+# 결과를 바꾸는 설정 (상태 파일에 남겨서 바뀌면 다시 처리해요)
+RESULT_OPTIONS = ('formats', 'seating_formats', 'method', 'rows', 'cols', 'population_size', 'generations', 'seed')
+
+
+def find_jobs(source):
+    """폴더나 manifest 파일에서 반 목록 만들기 [{'name', 'path', 'rows', 'cols'}]"""
+    jobs = []
+    if os.path.isdir(source):
+        for file_name in sorted(os.listdir(source)):
+            stem, extension = os.path.splitext(file_name)
+            if extension.lower() in SURVEY_EXTENSIONS and not file_name.startswith(('.', '~$')):
+                jobs.append({'name': stem, 'path': os.path.join(source, file_name), 'rows': None, 'cols': None})
+    else:
+        manifest = pd.read_csv(source, encoding='utf-8-sig', dtype={'name': str})
+        if 'path' not in manifest.columns:
+            raise ValueError("manifest에는 path 열이 있어야 해요.")
+        base_dir = os.path.dirname(os.path.abspath(source))
+        for _, row in manifest.iterrows():
+            path = str(row['path'])
+            if not os.path.isabs(path):
+                path = os.path.join(base_dir, path)
+            name = row.get('name')
+            if pd.isna(name) or not str(name).strip():
+                name = os.path.splitext(os.path.basename(path))[0]
+            jobs.append({
+                'name': str(name).strip(),
+                'path': path,
+                'rows': None if pd.isna(row.get('rows')) else int(row['rows']),
+                'cols': None if pd.isna(row.get('cols')) else int(row['cols']),
+            })
+
+    names = [job['name'] for job in jobs]
+    for name in names:
+        # 반 이름은 결과 폴더 안의 폴더 이름으로 써요
+        if not name or name == '.' or '..' in name or '/' in name or '\\' in name:
+            raise ValueError(f"반 이름에 쓸 수 없는 글자가 있어요: {name}")
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"같은 반 이름이 여러 번 나와요: {', '.join(duplicates)}")
+    return jobs
+
+
+def file_hash(path):
+    """설문 파일 내용의 해시 (파일이 바뀌었으면 다시 처리하려고)"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_survey(path):
+    """CSV/XLSX 설문 파일 읽기"""
+    if path.lower().endswith('.xlsx'):
+        return pd.read_excel(path)
+    return pd.read_csv(path, encoding='utf-8-sig')
+
+
+def write_text(path, content):
+    """다 쓴 다음에 이름을 바꿔서, 중간에 멈춰도 반쯤 쓴 파일이 남지 않게 하기"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+def read_status(class_dir):
+    """반 폴더의 상태 파일 읽기 (없거나 깨졌으면 None)"""
+    try:
+        with open(os.path.join(class_dir, STATUS_FILE), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def job_options(job, options):
+    """반 하나의 결과를 정하는 설정 (상태 파일에 남기는 값)"""
+    settings = {name: options.get(name) for name in RESULT_OPTIONS}
+    settings['job_rows'] = job.get('rows')
+    settings['job_cols'] = job.get('cols')
+    return json.loads(json.dumps(settings))
+
+
+def classroom_shape(num_students, rows=None, cols=None):
+    """정해지지 않은 교실 크기를 학생 수에 맞게 채우기"""
+    if rows and cols:
+        return rows, cols
+    if cols:
+        return max(1, math.ceil(num_students / cols)), cols
+    if rows:
+        return rows, max(1, math.ceil(num_students / rows))
+    return max(1, math.ceil(num_students / DEFAULT_COLS)), DEFAULT_COLS
+
+
+def process_class(job, options):
+    """반 하나 분석하고 보고서와 자리 배치표 저장하기 (작업 프로세스에서 실행)"""
+    start = time.perf_counter()
+    class_dir = os.path.join(options['output'], job['name'])
+    os.makedirs(class_dir, exist_ok=True)
+
+    analyzer = FriendshipAnalyzer()
+    analyzer.load_data(read_survey(job['path']))
+    analyzer.build_relationship_graph()
+    stats = analyzer.get_friendship_statistics()
+    overall = analyzer.get_class_overall_analysis()
+
+    for report_format in options['formats']:
+        file_name, create = REPORT_FORMATS[report_format]
+        write_text(os.path.join(class_dir, file_name), create(stats, overall))
+
+    result = {
+        'name': job['name'],
+        'status': 'done',
+        'input_hash': job['input_hash'],
+        'options': job_options(job, options),
+        'students': len(analyzer.students),
+        'connections': analyzer.graph.number_of_edges(),
+    }
+
+    if options['seating_formats'] and analyzer.students:
+        rows, cols = classroom_shape(len(analyzer.students), job.get('rows') or options['rows'],
+                                     job.get('cols') or options['cols'])
+        optimizer = SeatingOptimizer(analyzer.graph)
+        optimizer.create_classroom_layout(rows, cols)
+        if rows * cols < len(optimizer.students):
+            raise ValueError(f"자리({rows}x{cols})가 학생 수({len(optimizer.students)}명)보다 적어요.")
+
+        method = options['method']
+        if method == 'greedy':
+            seating = optimizer.optimize_seating_greedy(seed=options['seed'])
+            score = optimizer.calculate_seating_score(seating)
+        elif method == 'annealing':
+            seating, score = optimizer.optimize_seating_annealing(seed=options['seed'])
+        else:
+            seating, score = optimizer.optimize_seating_genetic(
+                population_size=options['population_size'], generations=options['generations'],
+                seed=options['seed']
+            )
+
+        seating_data = {'seating': seating, 'score': score, 'layout': {'rows': rows, 'cols': cols}}
+        for seating_format in options['seating_formats']:
+            file_name, create = SEATING_FORMATS[seating_format]
+            write_text(os.path.join(class_dir, file_name), create(seating_data))
+        result['seating_score'] = float(score)
+        result['layout'] = [rows, cols]
+
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    # 상태 파일은 모든 결과를 쓴 다음 마지막에 남기기
+    write_text(os.path.join(class_dir, STATUS_FILE), json.dumps(result, ensure_ascii=False, indent=2))
+    return result
+
+
+def run_batch(jobs, options, workers=None, force=False, progress=print):
+    """여러 반을 작업 프로세스로 나눠 처리하고 반별 결과 목록 돌려주기"""
+    os.makedirs(options['output'], exist_ok=True)
+
+    pending = []
+    results = []
+    for job in jobs:
+        job = dict(job, input_hash=file_hash(job['path']))
+        status = read_status(os.path.join(options['output'], job['name']))
+        if (not force and status and status.get('status') == 'done'
+                and status.get('input_hash') == job['input_hash']
+                and status.get('options') == job_options(job, options)):
+            results.append(dict(status, skipped=True))
+        else:
+            pending.append(job)
+
+    total = len(jobs)
+    done = len(results)
+    if done:
+        progress(f"⏭️ 이미 끝난 {done}개 반은 건너뛰어요.")
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(process_class, job, options): job for job in pending}
+            try:
+                for future in as_completed(futures):
+                    job = futures[future]
+                    done += 1
+                    try:
+                        result = future.result()
+                        progress(f"[{done}/{total}] ✅ {job['name']} - 학생 {result['students']}명, "
+                                 f"{result['seconds']:.2f}초")
+                    except Exception as e:
+                        result = {'name': job['name'], 'status': 'failed', 'error': f"{type(e).__name__}: {e}"}
+                        progress(f"[{done}/{total}] ❌ {job['name']} - {result['error']}")
+                    results.append(result)
+            except KeyboardInterrupt:
+                # 아직 시작하지 않은 반은 취소 (다음 실행에서 이어서 해요)
+                for future in futures:
+                    future.cancel()
+                raise
+
+    order = {job['name']: i for i, job in enumerate(jobs)}
+    results.sort(key=lambda result: order[result['name']])
+    return results
+
+
+def write_summary(results, output):
+    """반별 결과를 summary.csv로 저장하기"""
+    columns = ['name', 'status', 'students', 'connections', 'seating_score', 'seconds', 'error']
+    summary = pd.DataFrame(results).reindex(columns=columns)
+    path = os.path.join(output, 'summary.csv')
+    summary.to_csv(path, index=False, encoding='utf-8-sig')
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="여러 반 친구관계 설문 한꺼번에 분석하기")
+    parser.add_argument('source', help="설문 파일(CSV/XLSX)이 있는 폴더나 manifest CSV 파일")
+    parser.add_argument('--output', default='batch_output', help="결과를 저장할 폴더")
+    parser.add_argument('--workers', type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--formats', nargs='*', default=list(REPORT_FORMATS), choices=list(REPORT_FORMATS),
+                        help="분석 보고서 형식")
+    parser.add_argument('--seating-formats', nargs='*', default=list(SEATING_FORMATS),
+                        choices=list(SEATING_FORMATS), help="자리 배치표 형식 (비우면 자리 배치를 안 해요)")
+    parser.add_argument('--method', default='genetic', choices=SEATING_METHODS, help="자리 배치 방법")
+    parser.add_argument('--rows', type=int, default=None, help="교실 세로 줄 수 (기본: 학생 수에 맞춤)")
+    parser.add_argument('--cols', type=int, default=None, help="교실 가로 줄 수 (기본: 6)")
+    parser.add_argument('--population-size', type=int, default=200, help="유전 알고리즘 인구 수")
+    parser.add_argument('--generations', type=int, default=200, help="유전 알고리즘 세대 수")
+    parser.add_argument('--seed', type=int, default=42, help="자리 배치 seed (같은 설문이면 같은 결과)")
+    parser.add_argument('--force', action='store_true', help="이미 끝난 반도 다시 처리하기")
+    args = parser.parse_args(argv)
+
+    jobs = find_jobs(args.source)
+    if not jobs:
+        print("❌ 처리할 설문 파일이 없어요.")
+        return 1
+
+    options = {
+        'output': args.output,
+        'formats': args.formats,
+        'seating_formats': args.seating_formats,
+        'method': args.method,
+        'rows': args.rows,
+        'cols': args.cols,
+        'population_size': args.population_size,
+        'generations': args.generations,
+        'seed': args.seed,
+    }
+
+    start = time.perf_counter()
+    print(f"📂 {len(jobs)}개 반을 처리해요.", flush=True)
+    results = run_batch(jobs, options, workers=args.workers, force=args.force,
+                        progress=lambda message: print(message, flush=True))
+    summary_path = write_summary(results, args.output)
+
+    failed = [result for result in results if result['status'] != 'done']
+    print(f"\n🏁 {len(results) - len(failed)}개 반 완료, {len(failed)}개 반 실패 "
+          f"({time.perf_counter() - start:.1f}초)")
+    print(f"💾 요약: {summary_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
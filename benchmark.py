@@ -0,0 +1,212 @@
+"""친구관계 분석 성능 측정
+
+여러 학생 수로 가짜 설문을 만들어 단계별 시간, 최대 메모리, 자리 배치 점수를 재고
+결과를 JSON으로 저장해요. 버전끼리 결과 파일을 비교해서 느려진 곳을 찾을 수 있어요.
+
+    python benchmark.py --sizes 20 40 200 --output bench.json
+    python benchmark.py --compare old.json new.json
+"""
+import argparse
+import gc
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from friendship_analyzer import FriendshipAnalyzer
+from sample_data import generate_sample_data
+from seating_optimizer import SeatingOptimizer
+
+DEFAULT_SIZES = [20, 40, 200, 2000, 20000]
+
+# 측정할 그림 만들기 함수들
+FIGURE_METHODS = [
+    'create_network_visualization',
+    'create_heatmap_network',
+    'create_group_colored_network',
+    'create_3d_network',
+    'create_force_directed_network',
+    'create_interactive_relationship_map',
+    'create_circular_group_visualization',
+    'create_statistics_charts',
+]
+
+# 이보다 느려지면 비교할 때 표시하기 (1.2 = 20% 느려짐)
+REGRESSION_RATIO = 1.2
+
+
+def measure(func, track_memory=True):
+    """함수 한 번 실행하고 (결과, 걸린 시간, 최대 메모리 MB) 돌려주기"""
+    gc.collect()
+    if track_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = func()
+    finally:
+        seconds = time.perf_counter() - start
+        peak_mb = None
+        if track_memory:
+            peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+    return result, seconds, peak_mb
+
+
+def run_stage(stages, name, func, track_memory=True):
+    """한 단계를 재서 stages에 기록하기 (에러가 나도 다음 단계는 계속)"""
+    try:
+        result, seconds, peak_mb = measure(func, track_memory)
+    except Exception as e:
+        stages[name] = {'error': f"{type(e).__name__}: {e}"}
+        return None
+    stages[name] = {'seconds': round(seconds, 6)}
+    if peak_mb is not None:
+        stages[name]['peak_mb'] = round(peak_mb, 3)
+    return result
+
+
+def classroom_shape(num_students):
+    """학생 수에 맞는 (세로줄, 가로줄)"""
+    rows = max(1, int(math.sqrt(num_students)))
+    cols = math.ceil(num_students / rows)
+    return rows, cols
+
+
+def benchmark_size(num_students, seed=42, max_figure_students=2000, max_seating_students=2000,
+                   track_memory=True):
+    """학생 수 하나에 대해 모든 단계 재기"""
+    stages = {}
+    skipped = []
+    df = generate_sample_data(num_students=num_students, seed=seed)
+
+    analyzer = FriendshipAnalyzer()
+    run_stage(stages, 'load_data', lambda: analyzer.load_data(df), track_memory)
+    run_stage(stages, 'build_relationship_graph', analyzer.build_relationship_graph, track_memory)
+    run_stage(stages, 'get_class_overall_analysis', analyzer.get_class_overall_analysis, track_memory)
+    run_stage(stages, 'get_friendship_statistics', analyzer.get_friendship_statistics, track_memory)
+
+    if num_students <= max_figure_students:
+        for method in FIGURE_METHODS:
+            # 앞 단계가 계산해 둔 레이아웃/그룹/중간 역할 점수를 쓰면 뒤 그림 시간이 너무 적게 나와요
+            analyzer.clear_caches()
+            run_stage(stages, method, getattr(analyzer, method), track_memory)
+    else:
+        skipped.extend(FIGURE_METHODS)
+
+    seating = {}
+    if num_students <= max_seating_students and analyzer.graph is not None:
+        optimizer = SeatingOptimizer(analyzer.graph)
+        rows, cols = classroom_shape(len(optimizer.students))
+        optimizer.create_classroom_layout(rows, cols)
+
+        baseline = optimizer.calculate_seating_score(optimizer.random_seating())
+        seating['classroom'] = [rows, cols]
+        seating['random_score'] = round(float(baseline), 6)
+
+        result = run_stage(stages, 'optimize_seating_genetic',
+                           lambda: optimizer.optimize_seating_genetic(seed=seed), track_memory)
+        if result is not None:
+            seating['genetic_score'] = round(float(result[1]), 6)
+
+        result = run_stage(stages, 'optimize_seating_greedy',
+                           lambda: optimizer.optimize_seating_greedy(seed=seed), track_memory)
+        if result is not None:
+            seating['greedy_score'] = round(float(optimizer.calculate_seating_score(result)), 6)
+    else:
+        skipped.extend(['optimize_seating_genetic', 'optimize_seating_greedy'])
+
+    return {
+        'students': num_students,
+        'edges': analyzer.graph.number_of_edges() if analyzer.graph is not None else 0,
+        'seed': seed,
+        'stages': stages,
+        'seating': seating,
+        'skipped': skipped,
+    }
+
+
+def run_benchmarks(sizes, seed=42, max_figure_students=2000, max_seating_students=2000,
+                   track_memory=True, progress=None):
+    """여러 학생 수로 재고 JSON으로 저장할 수 있는 결과 만들기"""
+    results = []
+    for num_students in sizes:
+        if progress:
+            progress(f"👥 학생 {num_students}명 측정 중...")
+        results.append(benchmark_size(num_students, seed, max_figure_students,
+                                      max_seating_students, track_memory))
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'memory_tracked': track_memory,
+        'results': results,
+    }
+
+
+def compare_results(old, new, ratio=REGRESSION_RATIO):
+    """두 결과 파일을 비교해서 (학생 수, 단계, 예전 시간, 지금 시간, 배수) 목록 돌려주기"""
+    old_by_size = {result['students']: result for result in old['results']}
+    rows = []
+    for result in new['results']:
+        previous = old_by_size.get(result['students'])
+        if previous is None:
+            continue
+        for stage, timing in result['stages'].items():
+            before = previous['stages'].get(stage, {}).get('seconds')
+            after = timing.get('seconds')
+            if before is None or after is None:
+                continue
+            change = after / before if before > 0 else float('inf')
+            rows.append((result['students'], stage, before, after, change, change >= ratio))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="친구관계 분석 성능 측정")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="측정할 학생 수들")
+    parser.add_argument('--seed', type=int, default=42, help="가짜 설문과 자리 배치에 쓸 seed")
+    parser.add_argument('--output', default='benchmark_results.json', help="결과 JSON 파일")
+    parser.add_argument('--max-figure-students', type=int, default=2000,
+                        help="이보다 학생이 많으면 그림 만들기는 건너뛰기")
+    parser.add_argument('--max-seating-students', type=int, default=2000,
+                        help="이보다 학생이 많으면 자리 배치는 건너뛰기")
+    parser.add_argument('--no-memory', action='store_true', help="메모리 측정 끄기 (시간이 더 정확해져요)")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help="두 결과 파일 비교하기")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0], encoding='utf-8') as f:
+            old = json.load(f)
+        with open(args.compare[1], encoding='utf-8') as f:
+            new = json.load(f)
+        regressions = 0
+        for students, stage, before, after, change, slower in compare_results(old, new):
+            mark = '⚠️' if slower else '  '
+            print(f"{mark} {students:>6}명 {stage:<40} {before:9.4f}s → {after:9.4f}s ({change:.2f}배)")
+            regressions += slower
+        return 1 if regressions else 0
+
+    report = run_benchmarks(args.sizes, args.seed, args.max_figure_students,
+                            args.max_seating_students, not args.no_memory, progress=print)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    for result in report['results']:
+        print(f"\n👥 학생 {result['students']}명 (관계 {result['edges']}개)")
+        for stage, timing in result['stages'].items():
+            if 'error' in timing:
+                print(f"  {stage:<40} ❌ {timing['error']}")
+            else:
+                memory = f" {timing['peak_mb']:9.1f}MB" if 'peak_mb' in timing else ''
+                print(f"  {stage:<40} {timing['seconds']:9.4f}s{memory}")
+        if result['seating']:
+            print(f"  🪑 자리 배치 점수: {result['seating']}")
+    print(f"\n💾 결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""그래프 그림(Plotly JSON)을 디스크에 저장해 두고 다시 쓰기
+
+같은 반 그림을 여러 선생님이 하루에도 몇 번씩 보는데, 그때마다 NetworkX 계산과
+Plotly 그림 만들기를 다시 하지 않도록 만든 그림의 JSON을 파일로 저장해요.
+저장 이름은 설문 응답 해시 + 그림 이름 + 설정으로 정하고, 전체 크기가 max_bytes를
+넘으면 가장 오래 안 본 그림부터 지워요 (파일 수정 시각을 마지막으로 본 시각으로 써요).
+
+저장 폴더는 FIGURE_CACHE_DIR, 최대 크기(MB)는 FIGURE_CACHE_MAX_MB 환경 변수로 바꿀 수 있어요.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+import plotly
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'FIGURE_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'friendship_analyzer_figures')
+)
+DEFAULT_MAX_BYTES = int(float(os.environ.get('FIGURE_CACHE_MAX_MB', 200)) * 1024 * 1024)
+# 그림을 만드는 코드가 바뀌어서 예전 그림을 쓰면 안 될 때 올리기
+CACHE_VERSION = 1
+FIGURE_EXTENSION = '.json'
+
+
+class FigureCache:
+    """그림 JSON 디스크 저장소 (크기 제한, 오래 안 본 것부터 지우기)"""
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(data_key, figure_name, params=None):
+        """설문 응답 해시, 그림 이름, 설정으로 저장 이름 만들기"""
+        description = json.dumps([CACHE_VERSION, plotly.__version__, data_key, figure_name, params or {}],
+                                 sort_keys=True, ensure_ascii=False, default=str)
+        return f"{figure_name}-{hashlib.sha1(description.encode('utf-8')).hexdigest()}"
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + FIGURE_EXTENSION)
+
+    def get(self, key):
+        """저장해 둔 그림 JSON 글자 (없으면 None)"""
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                content = f.read()
+            # 방금 본 그림은 늦게 지워지도록 시각 고치기
+            os.utime(path)
+        except OSError:
+            return None
+        return content
+
+    def put(self, key, content):
+        """그림 JSON 저장하기 (다 쓴 다음 이름 바꾸기, 저장에 실패해도 그림은 보여줘야 하니 넘어가요)"""
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return False
+        self.evict()
+        return True
+
+    def _entries(self):
+        """저장된 그림 파일 [(마지막으로 본 시각, 크기, 경로)]"""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as scan:
+                for entry in scan:
+                    if not entry.name.endswith(FIGURE_EXTENSION):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            pass
+        return entries
+
+    @staticmethod
+    def _remove(path):
+        """그림 파일 하나 지우기 (지웠거나 이미 없으면 True)"""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass  # 다른 프로세스가 먼저 지웠어요
+        except OSError:
+            return False
+        return True
+
+    def evict(self):
+        """전체 크기가 max_bytes 이하가 될 때까지 가장 오래 안 본 그림 지우기"""
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if self._remove(path):
+                    removed += 1
+                    total -= size
+            return removed
+
+    def get_or_build(self, data_key, figure_name, build_json, params=None):
+        """(그림 JSON 글자, 저장소에서 찾았는지) - 없으면 build_json()으로 만들어서 저장해요"""
+        key = self.make_key(data_key, figure_name, params)
+        content = self.get(key)
+        if content is not None:
+            return content, True
+        content = build_json()
+        self.put(key, content)
+        return content, False
+
+    def clear(self):
+        """저장해 둔 그림 모두 지우기"""
+        with self._lock:
+            return sum(self._remove(path) for _, _, path in self._entries())
+
+
+_default_cache = None
+
+
+def get_figure_cache():
+    """기본 설정(FIGURE_CACHE_DIR, FIGURE_CACHE_MAX_MB)의 그림 저장소"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = FigureCache()
+    return _default_cache
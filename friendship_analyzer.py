@@ -6,167 +6,811 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 import re
 import math
+import time
+import hashlib
+from collections import OrderedDict
+from collections.abc import Mapping
+import perf_monitor
+import layout_engine
 try:
     from sklearn.cluster import SpectralClustering
     import community as community_louvain
     HAS_COMMUNITY = True
 except ImportError:
     HAS_COMMUNITY = False
+try:
+    import scipy.sparse as sp
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+# 관계 종류별 점수 (컬럼 이름에 들어 있는 글자, 점수) - 위에서부터 먼저 맞는 것을 사용
+RELATIONSHIP_WEIGHTS = [
+    ('가장 친한', 5),
+    ('자주 대화', 3),
+    ('도움을 요청', 4),
+    ('도와준', 3),
+    ('갈등', -2),
+    ('친해지고 싶은', 2),
+]
+
+# 친구 이름 구분 기호 (쉼표, 세미콜론, 슬래시, 줄바꿈)
+FRIEND_SEPARATORS = r'[,;/\n]'
+
+MENTION_COLUMNS = ['row', 'column', 'source', 'token', 'target', 'relation', 'weight']
+
+# 기본 네트워크의 관계별 선 모양 (색, 두께, 이름)
+NETWORK_EDGE_STYLES = [
+    ('red', 4, '가장 친한 관계'),
+    ('blue', 3, '친한 관계'),
+    ('gray', 2, '일반 관계'),
+    ('orange', 2, '안 좋은 관계')
+]
+
+# 힘-기반 레이아웃의 관계별 선 모양 (색, 두께, 이름)
+FORCE_EDGE_STYLES = [
+    ('red', 3, '가장 친한 관계'),
+    ('blue', 2, '친한 관계'),
+    ('green', 1, '일반 관계'),
+    ('orange', 1, '안 좋은 관계')
+]
+
+# 학생이 이보다 많으면 WebGL(Scattergl)로 그리고 자세한 부분을 줄여요
+WEBGL_NODE_THRESHOLD = 300
+# WebGL로 그릴 때 남기는 선: 점수가 이 이상이거나 안 좋은 관계(0 이하)
+WEBGL_MIN_EDGE_WEIGHT = 3
+RENDER_MODES = ('auto', 'svg', 'webgl')
+
+# 저장해 둘 레이아웃 개수 (그래프 종류 x 알고리즘 x 설정)
+LAYOUT_CACHE_SIZE = 32
+
+# 레이아웃 엔진: 'networkx'(spring/kamada_kawai), 'fast'(layout_engine), 'auto'(학생 수로 정하기)
+LAYOUT_ENGINES = ('auto', 'networkx', 'fast')
+# 'auto'일 때 학생이 이보다 많으면 빠른 레이아웃 엔진 사용
+FAST_LAYOUT_MIN_NODES = 200
+
+# 그래프가 조금만 바뀌면 예전 위치에서 이어서 계산 (바뀐 학생 비율이 이 이하일 때)
+WARM_START_MAX_CHANGED = 0.2
+# 이어서 계산할 때 spring_layout 반복 수
+WARM_START_ITERATIONS = 20
+
+# 중간 역할 점수: 학생 수가 이보다 많으면 일부 학생(표본)만 기준으로 근사 계산
+BETWEENNESS_EXACT_MAX_NODES = 300
+BETWEENNESS_SAMPLES = 100
+BETWEENNESS_SEED = 42
+BETWEENNESS_MODES = ('auto', 'exact', 'approximate')
+
+# 그림 이름 -> 그림을 만드는 메서드 (get_figure로 처음 볼 때만 만들어요)
+FIGURE_BUILDERS = {
+    'network': 'create_network_visualization',
+    'heatmap': 'create_heatmap_network',
+    'group_colored': 'create_group_colored_network',
+    '3d': 'create_3d_network',
+    'force_directed': 'create_force_directed_network',
+    'interactive': 'create_interactive_relationship_map',
+    'circular_group': 'create_circular_group_visualization',
+    'statistics': 'create_statistics_charts',
+}
+
+# 큰 설문 파일을 나눠 읽을 때 한 번에 읽는 응답 수
+STREAM_CHUNK_ROWS = 50000
+
+# 그룹 찾기 방법
+COMMUNITY_METHODS = ('louvain', 'label_propagation', 'greedy_modularity')
+
+def dataset_hash(df):
+    """설문 응답 내용으로 만든 지문 (내용이 같으면 같은 값)"""
+    digest = hashlib.sha1()
+    digest.update(repr([str(col) for col in df.columns]).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def _edge_coordinates(pos, edges):
+    """선 좌표를 None으로 구분된 배열로 만들기 (선 하나에 점 3개)"""
+    edge_x = np.full(len(edges) * 3, None, dtype=object)
+    edge_y = np.full(len(edges) * 3, None, dtype=object)
+    
+    if edges:
+        start = np.array([pos[u] for u, _ in edges], dtype=float)
+        end = np.array([pos[v] for _, v in edges], dtype=float)
+        edge_x[0::3], edge_x[1::3] = start[:, 0], end[:, 0]
+        edge_y[0::3], edge_y[1::3] = start[:, 1], end[:, 1]
+    
+    return edge_x, edge_y
+
+class _StudentAnalysisView(Mapping):
+    """학생별 분석 결과 사전 (학생을 처음 볼 때 그 학생 것만 만들기)
+    
+    outgoing/incoming은 학생마다 (상대 학생, 점수) 목록이에요.
+    """
+    def __init__(self, students, outgoing, incoming):
+        self._students = students
+        self._outgoing = outgoing
+        self._incoming = incoming
+        self._analyses = {}
+    
+    def __getitem__(self, student_name):
+        if student_name not in self._analyses:
+            if student_name not in self._outgoing:
+                raise KeyError(student_name)
+            self._analyses[student_name] = self.build(student_name)
+        return self._analyses[student_name]
+    
+    def __iter__(self):
+        return iter(self._students)
+    
+    def __len__(self):
+        return len(self._students)
+    
+    def build(self, student_name):
+        """한 학생의 분석 결과 만들기"""
+        # 나가는 관계 (이 학생이 언급한 친구들) - 긍정적인 관계 (weight > 0)
+        positive_friends = []
+        negative_friends = []
+        for neighbor, weight in self._outgoing[student_name]:
+            if weight > 0:
+                positive_friends.append((neighbor, weight))
+            else:
+                negative_friends.append((neighbor, abs(weight)))
+        
+        # 들어오는 관계 (이 학생을 언급한 친구들, 학생 순서대로)
+        mentioned_by = list(self._incoming[student_name])
+        
+        # 인기도 계산
+        popularity_score = len(self._incoming[student_name])
+        sociability_score = len(self._outgoing[student_name])
+        
+        # 상호 관계 (서로 언급한 경우)
+        mentioned_me = {friend for friend, _ in mentioned_by}
+        mutual_friends = [friend for friend, _ in positive_friends if friend in mentioned_me]
+        
+        return {
+            'positive_friends': sorted(positive_friends, key=lambda x: x[1], reverse=True),
+            'negative_friends': sorted(negative_friends, key=lambda x: x[1], reverse=True),
+            'mentioned_by': sorted(mentioned_by, key=lambda x: x[1], reverse=True),
+            'mutual_friends': mutual_friends,
+            'popularity_score': popularity_score,
+            'sociability_score': sociability_score,
+            'is_popular': popularity_score >= len(self._students) * 0.3,  # 30% 이상이 언급하면 인기
+            'is_isolated': popularity_score <= 1,  # 1명 이하가 언급하면 고립
+            'is_low_mentioned': popularity_score <= 2  # 2명 이하가 언급
+        }
 
+@perf_monitor.instrument
 class FriendshipAnalyzer:
-    def __init__(self):
+    def __init__(self, backend='networkx'):
+        # 'networkx' 또는 'sparse' (scipy가 있을 때 희소 행렬로 계산)
+        self.backend = backend
+        # 중간 역할 점수 계산 방식 (BETWEENNESS_MODES 중 하나)
+        self.betweenness_mode = 'auto'
+        # 학생 위치 계산 방식 (LAYOUT_ENGINES 중 하나)
+        self.layout_engine = 'auto'
         self.data = None
         self.graph = None
         self.students = []
-        
+        self._name_exact = {}
+        self._name_substrings = {}
+        self._name_max_length = 0
+        self._name_lookup = {}
+        self._name_index_roster = None
+        self._graph_version = 0
+        self._graph_fingerprint = None
+        self._layout_cache = OrderedDict()
+        # 보기/알고리즘/설정마다 마지막으로 계산한 (위치, 그래프 요약) - 그래프가 바뀌어도 남겨요
+        self._last_layouts = {}
+        self._mentions = None
+        self._edge_support = {}
+        self._next_row = 0
+        self._streamed = False
+        self._stream_weights = {}
+        self._relations = None
+        self._sparse = None
+        self._sparse_metrics = None
+        self._betweenness = None
+        self._communities = {}
+        self._figures = None
+        
+    def __getstate__(self):
+        # 복사하거나 저장할 때 만들어 둔 그림은 빼기 (필요하면 다시 만들어요)
+        state = self.__dict__.copy()
+        state['_figures'] = None
+        return state
+    
     def load_data(self, df):
         """정보 불러오기 및 정리"""
-        self.data = df.copy()
+        # 줄 번호를 응답 번호로 사용 (0, 1, 2, ...)
+        self.data = df.reset_index(drop=True)
+        self._next_row = len(self.data)
+        
+        # 새 정보를 불러오면 예전 그래프는 버리기
+        self._reset_graph_state()
         
         # 학생 이름 찾기 (이름 컬럼에서)
-        name_column = None
-        for col in df.columns:
-            if '이름' in col or 'name' in col.lower():
-                name_column = col
-                break
+        self.students = self._students_from(self.data)
+        self._build_name_index()
+            
+        return True
+    
+    def _reset_graph_state(self):
+        self.graph = None
+        self._mentions = None
+        self._edge_support = {}
+        self._streamed = False
+        self._stream_weights = {}
+        self._graph_changed()
+    
+    def load_data_stream(self, source, chunksize=STREAM_CHUNK_ROWS, **read_options):
+        """큰 CSV 설문 파일을 나눠 읽으면서 바로 관계 그래프 만들기
+        
+        source는 파일 경로나 (처음으로 되감을 수 있는) 파일 객체예요.
+        1) 이름 컬럼만 읽어서 명단을 만들고, 2) 이름과 관계 컬럼만 조금씩 읽어서
+        선 점수에 더해요. 원래 응답 표는 보관하지 않으므로(self.data는 None)
+        응답 추가/삭제는 할 수 없어요. 응답 수를 돌려줘요.
+        """
+        read_options.setdefault('encoding', 'utf-8-sig')
+        
+        def read(**options):
+            if hasattr(source, 'seek'):
+                source.seek(0)
+            return pd.read_csv(source, dtype=str, **read_options, **options)
+        
+        columns = read(nrows=0).columns
+        header = pd.DataFrame(columns=columns)
+        name_column = self._find_name_column(header)
+        name_position = columns.get_loc(name_column) if name_column is not None else 1
+        relation_positions = [position for position, _, _ in self._relationship_columns(header)]
+        
+        self.data = None
+        self._reset_graph_state()
+        
+        # 1) 명단 (이름 컬럼에 처음 나온 순서대로)
+        roster = {}
+        for chunk in read(usecols=[name_position], chunksize=chunksize):
+            roster.update(dict.fromkeys(chunk.iloc[:, 0].dropna()))
+        self.students = list(roster)
+        self._build_name_index()
+        
+        # 2) 이름(과 이름이 빈 칸일 때 쓰는 두 번째 컬럼)과 관계 컬럼만 읽어서 선 점수 모으기
+        # 두 번째 컬럼이 그대로 두 번째에 오도록 첫 컬럼도 같이 읽어요
+        usecols = sorted({0, 1, name_position, *relation_positions} & set(range(len(columns))))
+        weights = self._stream_weights
+        support = self._edge_support
+        rows = 0
+        for chunk in read(usecols=usecols, chunksize=chunksize):
+            chunk.index = chunk.index + rows
+            rows += len(chunk)
+            edges = self._edge_contributions(self._build_mention_table(chunk), self.students)
+            grouped = edges.groupby(['source', 'target'], sort=False)['weight']
+            sums = grouped.sum()
+            for edge, weight, count in zip(sums.index, sums.tolist(), grouped.size().tolist()):
+                weights[edge] = weights.get(edge, 0) + weight
+                support[edge] = support.get(edge, 0) + count
+        
+        self._next_row = rows
+        self._streamed = True
+        self.build_relationship_graph()
+        return rows
+    
+    def _students_from(self, df):
+        """응답에서 학생 명단 만들기"""
+        name_column = self._find_name_column(df)
         
         if name_column:
-            self.students = df[name_column].dropna().unique().tolist()
-        else:
-            # 이름 컬럼이 없으면 두 번째 컬럼을 이름으로 가정
-            self.students = df.iloc[:, 1].dropna().unique().tolist()
-            
+            return df[name_column].dropna().unique().tolist()
+        # 이름 컬럼이 없으면 두 번째 컬럼을 이름으로 가정
+        return df.iloc[:, 1].dropna().unique().tolist()
+    
+    def add_responses(self, df_new):
+        """새 설문 응답 추가하기 (새 응답이 건드리는 관계만 고치기)"""
+        if self._streamed:
+            raise ValueError("나눠 읽은 설문에는 응답을 추가할 수 없어요. 전체를 다시 불러와 주세요.")
+        if self.data is None:
+            return self.load_data(df_new)
+        
+        # 이어지는 응답 번호 붙이기
+        df_new = df_new.reset_index(drop=True)
+        df_new.index = df_new.index + self._next_row
+        self._next_row += len(df_new)
+        self.data = pd.concat([self.data, df_new])
+        
+        self._update_relationships(removed_rows=[], new_data=df_new)
         return True
     
+    def remove_response(self, student):
+        """한 학생의 응답 지우기 (그 응답과 그 학생을 가리키던 관계만 고치기)"""
+        if self._streamed:
+            raise ValueError("나눠 읽은 설문에서는 응답을 지울 수 없어요. 전체를 다시 불러와 주세요.")
+        if self.data is None:
+            return False
+        
+        sources = self._response_sources(self.data)
+        removed_rows = sources.index[sources == student]
+        if len(removed_rows) == 0:
+            return False
+        
+        self.data = self.data.drop(removed_rows)
+        self._update_relationships(removed_rows=removed_rows, new_data=None)
+        return True
+    
+    def _find_name_column(self, df):
+        """이름 컬럼 찾기 (없으면 None)"""
+        for col in df.columns:
+            if '이름' in col or 'name' in col.lower():
+                return col
+        return None
+    
+    def _ensure_name_index(self):
+        """명단이 바뀌었으면 이름 색인 다시 만들기"""
+        if self._name_index_roster != (id(self.students), len(self.students)):
+            self._build_name_index()
+    
+    def _build_name_index(self):
+        """학생 이름 찾기용 색인 만들기 (load_data에서 한 번만)"""
+        # 이름 -> 명단 순서, 이름의 모든 부분 글자 -> 그 글자를 포함하는 첫 번째 학생 순서
+        self._name_exact = {}
+        self._name_substrings = {}
+        self._name_max_length = 0
+        self._name_lookup = {}
+        self._name_index_roster = (id(self.students), len(self.students))
+        
+        for index, student in enumerate(self.students):
+            if not isinstance(student, str):
+                continue
+            self._name_exact.setdefault(student, index)
+            self._name_max_length = max(self._name_max_length, len(student))
+            for start in range(len(student)):
+                for end in range(start + 1, len(student) + 1):
+                    self._name_substrings.setdefault(student[start:end], index)
+    
+    def _resolve_name(self, friend):
+        """적힌 이름을 명단의 학생 이름으로 바꾸기 (없으면 None)
+        
+        명단 순서대로 `friend in student or student in friend`를 검사해서
+        처음 맞는 학생을 고르던 규칙과 같은 답을 돌려줘요.
+        """
+        if friend in self._name_lookup:
+            return self._name_lookup[friend]
+        
+        # friend가 학생 이름의 일부인 경우
+        best = self._name_substrings.get(friend, len(self.students))
+        
+        # 학생 이름이 friend 안에 들어 있는 경우 (이름 길이까지만 잘라서 확인)
+        if '' in self._name_exact:
+            best = min(best, self._name_exact[''])
+        for length in range(1, min(self._name_max_length, len(friend)) + 1):
+            for start in range(len(friend) - length + 1):
+                index = self._name_exact.get(friend[start:start + length])
+                if index is not None and index < best:
+                    best = index
+        
+        student = self.students[best] if best < len(self.students) else None
+        self._name_lookup[friend] = student
+        return student
+    
     def parse_friends_list(self, text):
         """친구 목록 글자를 리스트로 바꾸기"""
         if pd.isna(text) or text == "":
             return []
         
         # 쉼표, 세미콜론, 슬래시로 분리
-        friends = re.split(r'[,;/\n]', str(text))
+        friends = re.split(FRIEND_SEPARATORS, str(text))
         friends = [f.strip() for f in friends if f.strip()]
         
+        self._ensure_name_index()
+        
         # 우리 반 학생 이름만 골라내기
         valid_friends = []
         for friend in friends:
             # 학생 명단에 있는 이름과 맞는지 확인
-            for student in self.students:
-                if friend in student or student in friend:
-                    valid_friends.append(student)
-                    break
+            student = self._resolve_name(friend)
+            if student is not None:
+                valid_friends.append(student)
         
-        return list(set(valid_friends))  # 중복 제거
+        return list(dict.fromkeys(valid_friends))  # 중복 제거 (처음 나온 순서 유지)
+    
+    def _relationship_columns(self, df):
+        """관계 컬럼과 점수를 한 번만 정리하기 [(컬럼 위치, 관계, 점수), ...]"""
+        columns = []
+        for position, col in enumerate(df.columns):
+            for relation, weight in RELATIONSHIP_WEIGHTS:
+                if relation in col:
+                    columns.append((position, relation, weight))
+                    break
+        return columns
+    
+    def _response_sources(self, df):
+        """응답마다 답한 학생 이름 찾기"""
+        fallback = df.iloc[:, 1]  # 두 번째 컬럼을 이름으로 가정
+        name_column = self._find_name_column(df)
+        if name_column is None:
+            return fallback
+        
+        names = df[name_column]
+        # 이름 칸이 비어 있으면 두 번째 컬럼 사용
+        return names.where(names.map(bool), fallback)
+    
+    def _build_mention_table(self, df):
+        """설문 응답을 (source, token, target, relation, weight) 긴 표로 펼치기
+        
+        관계 컬럼마다 글자 나누기/펼치기를 한 번에 해요. 명단에 없는 이름은
+        target이 비어 있어요. 줄 순서는 응답 -> 질문 -> 적은 순서예요.
+        """
+        self._ensure_name_index()
+        sources = self._response_sources(df)
+        
+        frames = []
+        for column_order, (position, relation, weight) in enumerate(self._relationship_columns(df)):
+            cells = df.iloc[:, position]
+            cells = cells[cells.notna() & (cells != "")]
+            if cells.empty:
+                continue
+            
+            tokens = cells.astype(str).str.split(FRIEND_SEPARATORS, regex=True).explode().str.strip()
+            tokens = tokens[tokens != ""]
+            
+            # 같은 글자는 한 번만 이름 찾기
+            lookup = {token: self._resolve_name(token) for token in tokens.unique()}
+            
+            frames.append(pd.DataFrame({
+                'row': tokens.index.to_numpy(),
+                'column': column_order,
+                'source': sources.loc[tokens.index].to_numpy(),
+                'token': tokens.to_numpy(),
+                'target': tokens.map(lookup).to_numpy(),
+                'relation': relation,
+                'weight': weight
+            }))
+        
+        if not frames:
+            return pd.DataFrame(columns=MENTION_COLUMNS)
+        
+        mentions = pd.concat(frames, ignore_index=True)
+        return mentions.sort_values(['row', 'column'], kind='stable', ignore_index=True)
+    
+    def _edge_contributions(self, mentions, students):
+        """펼친 표에서 실제로 선이 되는 줄만 고르기
+        
+        명단에 있는 학생이 쓴 응답만, 한 칸 안의 같은 친구는 한 번만,
+        자기 자신은 빼요.
+        """
+        edges = mentions[mentions['source'].isin(students) & mentions['target'].notna()]
+        edges = edges.drop_duplicates(['row', 'column', 'target'])
+        return edges[edges['source'] != edges['target']]
     
     def build_relationship_graph(self):
         """친구 관계 그래프 만들기"""
         self.graph = nx.DiGraph()
         
         # 모든 학생을 점으로 추가
-        for student in self.students:
-            self.graph.add_node(student)
-        
-        # 관계별 점수 정하기
-        weights = {
-            '가장 친한': 5,
-            '자주 대화': 3,
-            '도움 요청': 4,
-            '도와준': 3,
-            '갈등': -2,
-            '친해지고 싶은': 2
-        }
+        self.graph.add_nodes_from(self.students)
         
-        for idx, row in self.data.iterrows():
-            student_name = None
-            
-            # 학생 이름 찾기
-            for col in self.data.columns:
-                if '이름' in col or 'name' in col.lower():
-                    student_name = row[col]
-                    break
-            
-            if not student_name:
-                student_name = row.iloc[1]  # 두 번째 컬럼을 이름으로 가정
-            
-            if student_name not in self.students:
+        if self._streamed:
+            # 나눠 읽을 때 모아 둔 선 점수로 만들기
+            self.graph.add_weighted_edges_from(
+                (source, target, weight) for (source, target), weight in self._stream_weights.items()
+            )
+            self._graph_changed()
+            return self.graph
+        
+        # 관계 컬럼별로 펼친 표를 만들고, 같은 두 학생 사이의 점수는 더하기
+        self._mentions = self._build_mention_table(self.data)
+        edges = self._edge_contributions(self._mentions, self.students)
+        grouped = edges.groupby(['source', 'target'], sort=False)['weight']
+        weights = grouped.sum()
+        
+        self.graph.add_weighted_edges_from(
+            (source, target, weight)
+            for (source, target), weight in zip(weights.index, weights.tolist())
+        )
+        # 선마다 몇 개의 응답 칸이 만들었는지 (응답을 지울 때 선을 없앨지 판단)
+        self._edge_support = dict(zip(weights.index, grouped.size().tolist()))
+        self._graph_changed()
+        
+        return self.graph
+    
+    def _update_relationships(self, removed_rows, new_data):
+        """바뀐 응답 칸만 다시 계산해서 명단과 그래프 고치기"""
+        old_students = self.students
+        new_students = self._students_from(self.data)
+        added = set(new_students) - set(old_students)
+        removed = set(old_students) - set(new_students)
+        
+        if added or removed:
+            # 명단이 늘면 못 찾던 이름만, 줄면 빠진 학생으로 찾았던 이름만 다시 찾기
+            lookup = self._name_lookup
+            self.students = new_students
+            self._build_name_index()
+            self._name_lookup = {
+                token: student for token, student in lookup.items()
+                if (student is not None or not added) and student not in removed
+            }
+        
+        if self.graph is None:
+            # 아직 그래프를 안 만들었으면 명단만 고치기
+            return
+        
+        # 다시 계산할 칸: 지운 응답, 쓴 학생이 명단에 들어오거나 빠진 응답,
+        # 빠진 학생을 가리키던 칸, (명단이 늘었으면) 못 찾은 이름이 있는 칸
+        mentions = self._mentions.copy()
+        touched = (mentions['row'].isin(removed_rows)
+                   | mentions['source'].isin(added | removed)
+                   | mentions['target'].isin(removed))
+        if added:
+            touched |= mentions['target'].isna()
+        cells = pd.MultiIndex.from_frame(mentions[['row', 'column']])
+        touched = cells.isin(cells[touched.to_numpy()])
+        
+        before = self._edge_contributions(mentions[touched], old_students)
+        
+        kept = ~mentions['row'].isin(removed_rows).to_numpy()
+        recompute = touched & kept
+        if added or removed:
+            mentions.loc[recompute, 'target'] = mentions.loc[recompute, 'token'].map(self._resolve_name)
+        after = [self._edge_contributions(mentions[recompute], self.students)]
+        mentions = mentions[kept]
+        
+        if new_data is not None:
+            new_mentions = self._build_mention_table(new_data)
+            after.append(self._edge_contributions(new_mentions, self.students))
+            mentions = pd.concat([mentions, new_mentions])
+        
+        self._mentions = mentions.reset_index(drop=True)
+        self._apply_edge_changes(before, pd.concat(after), added, removed)
+    
+    def _apply_edge_changes(self, before, after, added, removed):
+        """선 점수가 바뀐 만큼만 그래프에 더하고 빼기"""
+        changes = pd.concat([
+            after[['source', 'target', 'weight']].assign(count=1),
+            before[['source', 'target']].assign(weight=-before['weight'], count=-1)
+        ])
+        changes = changes.groupby(['source', 'target'], sort=False)[['weight', 'count']].sum()
+        
+        changed = bool(added or removed)
+        self.graph.add_nodes_from(student for student in self.students if student in added)
+        
+        for (source, target), weight, count in zip(changes.index,
+                                                   changes['weight'].tolist(),
+                                                   changes['count'].tolist()):
+            if weight == 0 and count == 0:
                 continue
+            changed = True
             
-            # 각 관계 종류별로 선 추가
-            for col in self.data.columns:
-                weight = 1
-                if '가장 친한' in col:
-                    weight = weights['가장 친한']
-                elif '자주 대화' in col:
-                    weight = weights['자주 대화']
-                elif '도움을 요청' in col:
-                    weight = weights['도움 요청']
-                elif '도와준' in col:
-                    weight = weights['도와준']
-                elif '갈등' in col:
-                    weight = weights['갈등']
-                elif '친해지고 싶은' in col:
-                    weight = weights['친해지고 싶은']
+            support = self._edge_support.get((source, target), 0) + count
+            if support <= 0:
+                self._edge_support.pop((source, target), None)
+                if self.graph.has_edge(source, target):
+                    self.graph.remove_edge(source, target)
+            else:
+                self._edge_support[(source, target)] = support
+                if self.graph.has_edge(source, target):
+                    self.graph[source][target]['weight'] += weight
                 else:
-                    continue
-                
-                friends = self.parse_friends_list(row[col])
-                for friend in friends:
-                    if friend in self.students and friend != student_name:
-                        # 이미 연결이 있으면 점수 더하기
-                        if self.graph.has_edge(student_name, friend):
-                            current_weight = self.graph[student_name][friend].get('weight', 0)
-                            self.graph[student_name][friend]['weight'] = current_weight + weight
-                        else:
-                            self.graph.add_edge(student_name, friend, weight=weight)
+                    self.graph.add_edge(source, target, weight=weight)
         
-        return self.graph
+        self.graph.remove_nodes_from(removed)
+        
+        if changed:
+            # 레이아웃은 그래프 지문으로 구분되니 버리지 않아도 돼요
+            self._graph_changed(rebuilt=False)
     
-    def create_network_visualization(self):
-        """네트워크형 인물 관계도 만들기 (클릭 인터랙션 포함)"""
-        if self.graph is None:
-            self.build_relationship_graph()
+    def _graph_changed(self, rebuilt=True):
+        """그래프가 바뀌면 저장해 둔 계산 결과 버리기"""
+        self._graph_version += 1
+        self._graph_fingerprint = None
+        if rebuilt:
+            self._layout_cache.clear()
+    
+    def clear_caches(self):
+        """저장해 둔 계산 결과(레이아웃, 관계, 희소 행렬, 중간 역할 점수, 그룹, 그림) 모두 버리기
+        
+        그래프는 그대로 두고, 다음에 부를 때 처음부터 다시 계산해요 (성능 측정용).
+        """
+        self._graph_fingerprint = None
+        self._layout_cache.clear()
+        self._last_layouts = {}
+        self._relations = None
+        self._sparse = None
+        self._sparse_metrics = None
+        self._betweenness = None
+        self._communities = {}
+        self._figures = None
+    
+    def _get_graph_fingerprint(self):
+        """그래프 내용(학생, 관계, 점수)으로 만든 지문"""
+        if self._graph_fingerprint is None:
+            digest = hashlib.sha1()
+            digest.update(repr(list(self.graph.nodes())).encode('utf-8'))
+            digest.update(repr(list(self.graph.edges(data='weight'))).encode('utf-8'))
+            self._graph_fingerprint = digest.hexdigest()
+        return self._graph_fingerprint
+    
+    def _resolve_layout_engine(self, graph):
+        """이 그래프에 쓸 레이아웃 엔진 ('networkx' 또는 'fast')"""
+        engine = self.layout_engine
+        if engine not in LAYOUT_ENGINES:
+            raise ValueError(f"알 수 없는 레이아웃 엔진이에요: {engine}")
+        if engine == 'auto':
+            engine = 'fast' if graph.number_of_nodes() > FAST_LAYOUT_MIN_NODES else 'networkx'
+        return engine
+    
+    @perf_monitor.timed('FriendshipAnalyzer._get_layout')
+    def _get_layout(self, graph, algorithm='spring', view='undirected', **params):
+        """레이아웃(학생 위치) 계산 결과를 저장해 두고 다시 쓰기
+        
+        graph는 self.graph에서 만든 그래프(view로 종류 구분)여야 해요.
+        같은 그래프, 알고리즘, 설정이면 한 번만 계산해요.
+        그래프가 조금만 바뀌었으면 지난번 위치에서 바뀐 학생만 움직여요.
+        """
+        engine = self._resolve_layout_engine(graph)
+        if engine == 'fast':
+            # 빠른 엔진은 알고리즘과 dim, seed 말고는 쓰지 않으니 같은 위치는 한 번만 계산
+            settings = (view, engine, None, (('dim', params.get('dim', 2)), ('seed', params.get('seed', 42))))
+        else:
+            settings = (view, engine, algorithm, tuple(sorted(params.items())))
+        key = (self._get_graph_fingerprint(),) + settings
+        if key in self._layout_cache:
+            self._layout_cache.move_to_end(key)
+            return self._layout_cache[key]
+        
+        signature = self._layout_signature(graph)
+        pos = self._warm_start_layout(graph, engine, params, signature, self._last_layouts.get(settings))
+        if pos is None:
+            if engine == 'fast':
+                # 스펙트럴 배치 + 격자 근사 힘 계산 (spring/kamada_kawai 대신)
+                pos = layout_engine.compute_layout(graph, dim=params.get('dim', 2), seed=params.get('seed', 42))
+            elif algorithm == 'kamada_kawai':
+                pos = nx.kamada_kawai_layout(graph, **params)
+            else:
+                pos = nx.spring_layout(graph, **params)
         
-        # 무방향 그래프로 변환하여 레이아웃 계산
-        undirected_graph = self.graph.to_undirected()
+        self._last_layouts[settings] = (pos, signature)
+        self._layout_cache[key] = pos
+        while len(self._layout_cache) > LAYOUT_CACHE_SIZE:
+            self._layout_cache.popitem(last=False)
         
-        # 봄-전기 모델로 위치 계산 (더 예쁘게)
-        pos = nx.spring_layout(undirected_graph, k=2, iterations=100, seed=42)
+        return pos
+    
+    def inherit_layouts(self, other):
+        """다른 분석기(같은 반의 예전 응답)가 마지막으로 계산한 위치에서 이어서 그리기"""
+        # 다른 사용자가 같은 분석기로 그리는 중일 수 있으니 복사해 두고 돌기
+        for settings, last in list(other._last_layouts.items()):
+            self._last_layouts.setdefault(settings, last)
+    
+    @staticmethod
+    def _layout_signature(graph):
+        """학생마다 (이웃, 점수) 묶음 - 지난번과 달라진 학생 찾기용"""
+        return {
+            node: frozenset((neighbor, data.get('weight', 1)) for neighbor, data in graph[node].items())
+            for node in graph.nodes()
+        }
+    
+    def _warm_start_layout(self, graph, engine, params, signature, previous):
+        """지난번 위치에서 바뀐 학생만 다시 놓기 (너무 많이 바뀌었으면 None)"""
+        if previous is None:
+            return None
+        old_pos, old_signature = previous
+        changed = {node for node, neighbors in signature.items() if old_signature.get(node) != neighbors}
+        if len(changed) > WARM_START_MAX_CHANGED * len(signature):
+            return None
+        if not changed:
+            # 이 그림에 쓰는 선은 그대로 (빠진 학생만 빼기)
+            return {node: old_pos[node] for node in graph.nodes()}
+        
+        fixed = {node for node in graph.nodes() if node not in changed}
+        if engine == 'fast':
+            return layout_engine.compute_layout(graph, dim=params.get('dim', 2), seed=params.get('seed', 42),
+                                                pos=old_pos, fixed=fixed)
+        
+        # 새로 들어온 학생은 자리가 있는 친구들 가운데에서 시작
+        start = {}
+        for node in graph.nodes():
+            if node in old_pos:
+                start[node] = old_pos[node]
+                continue
+            placed = [old_pos[neighbor] for neighbor in graph[node] if neighbor in old_pos]
+            if placed:
+                start[node] = np.mean(placed, axis=0)
+        # 고정하면 범위를 다시 맞추지 않으니, k는 설정값 대신 지난번 그림의 선 길이에 맞추기
+        lengths = [np.linalg.norm(np.asarray(old_pos[u]) - np.asarray(old_pos[v]))
+                   for u, v in graph.edges() if u in fixed and v in fixed]
+        k = float(np.median(lengths)) if lengths else None
+        # kamada_kawai는 학생을 고정할 수 없어서 이어서 계산할 때는 spring으로 바뀐 학생만 움직여요
+        options = {name: value for name, value in params.items() if name in ('seed', 'dim', 'weight')}
+        # kamada_kawai 보기는 설정이 없으니 처음 계산할 때와 같은 seed 쓰기 (그림 저장소에 같은 그림이 남게)
+        options.setdefault('seed', 42)
+        return nx.spring_layout(graph, k=k or None, pos=start or None, fixed=fixed or None,
+                                iterations=WARM_START_ITERATIONS, **options)
+    
+    def _figure_entry(self, name):
+        """그림 저장 칸 (그래프가 바뀌면 전부 비워요)"""
+        if name not in FIGURE_BUILDERS:
+            raise ValueError(f"알 수 없는 그림이에요: {name}")
+        if self.graph is None:
+            self.build_relationship_graph()
+        if self._figures is None or self._figures[0] != self._graph_version:
+            self._figures = (self._graph_version, {})
+        return self._figures[1].setdefault(name, {})
+    
+    def get_figure(self, name):
+        """그림 가져오기 (FIGURE_BUILDERS의 이름, 처음 볼 때만 만들기)"""
+        entry = self._figure_entry(name)
+        if 'figure' not in entry:
+            entry['figure'] = getattr(self, FIGURE_BUILDERS[name])()
+        return entry['figure']
+    
+    def get_figure_json(self, name):
+        """그림을 JSON 글자로 가져오기 (그래프가 바뀔 때까지 한 번만 바꿔요)"""
+        entry = self._figure_entry(name)
+        if 'json' not in entry:
+            entry['json'] = self.get_figure(name).to_json()
+        return entry['json']
+    
+    def _use_webgl(self, render_mode):
+        """WebGL로 그릴지 정하기 ('auto'면 학생 수로 정해요)"""
+        if render_mode not in RENDER_MODES:
+            raise ValueError(f"알 수 없는 그리기 방식이에요: {render_mode}")
+        if render_mode == 'auto':
+            return self.graph.number_of_nodes() > WEBGL_NODE_THRESHOLD
+        return render_mode == 'webgl'
+    
+    def _drawn_edges(self, webgl):
+        """그릴 선 목록 [(보낸 학생, 받은 학생, 점수)] (WebGL이면 약한 관계는 빼기)"""
+        edges = list(self.graph.edges(data='weight', default=1))
+        if webgl:
+            edges = [edge for edge in edges if edge[2] >= WEBGL_MIN_EDGE_WEIGHT or edge[2] <= 0]
+        return edges
+    
+    def _edge_style_traces(self, pos, edges, edge_styles, scatter, customdata=False):
+        """관계 종류마다 선 trace 하나씩 만들기 (약한 관계부터 그려서 진한 선이 위에 보이게)"""
+        weights = np.array([weight for _, _, weight in edges], dtype=float)
+        # 관계별로 다른 색깔과 두께 (가장 친한 > 친한 > 일반 > 안 좋은 관계)
+        styles = np.select([weights > 4, weights > 2, weights > 0], [0, 1, 2], default=3)
         
-        # 연결선 그리기
         edge_traces = []
-        
-        for edge in self.graph.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            
-            weight = self.graph[edge[0]][edge[1]].get('weight', 1)
-            
-            # 관계별로 다른 색깔과 두께
-            if weight > 4:  # 가장 친한 관계
-                color = 'red'
-                width = 4
-            elif weight > 2:  # 친한 관계
-                color = 'blue' 
-                width = 3
-            elif weight > 0:  # 일반 관계
-                color = 'gray'
-                width = 2
-            else:  # 안 좋은 관계
-                color = 'orange'
-                width = 2
+        for style in reversed(range(len(edge_styles))):
+            color, width, label = edge_styles[style]
+            style_edges = [edges[i][:2] for i in np.flatnonzero(styles == style)]
+            if not style_edges:
+                continue
             
-            edge_trace = go.Scatter(
-                x=[x0, x1, None], 
-                y=[y0, y1, None],
+            edge_x, edge_y = _edge_coordinates(pos, style_edges)
+            options = {}
+            if customdata:
+                # 각 선의 점마다 "보낸학생-받은학생" 이름 (클릭 기능용)
+                options['customdata'] = np.repeat([f"{u}-{v}" for u, v in style_edges], 3)
+            edge_traces.append(scatter(
+                x=edge_x,
+                y=edge_y,
                 mode='lines',
                 line=dict(width=width, color=color),
                 hoverinfo='none',
                 showlegend=False,
                 visible=True,
-                # 각 선에 고유 이름 추가 (클릭 기능용)
-                name=f"{edge[0]}-{edge[1]}"
-            )
-            edge_traces.append(edge_trace)
+                name=label,
+                **options
+            ))
+        return edge_traces
+    
+    def create_network_visualization(self, render_mode='auto'):
+        """네트워크형 인물 관계도 만들기 (클릭 인터랙션 포함)
+        
+        render_mode: 'auto'(학생이 많으면 WebGL), 'svg', 'webgl'.
+        WebGL로 그리면 이름 글자는 숨기고(마우스를 올리면 보여요) 약한 관계 선은 빼요.
+        """
+        if self.graph is None:
+            self.build_relationship_graph()
+        webgl = self._use_webgl(render_mode)
+        scatter = go.Scattergl if webgl else go.Scatter
+        
+        # 무방향 그래프로 변환하여 레이아웃 계산
+        undirected_graph = self.graph.to_undirected()
+        
+        # 봄-전기 모델로 위치 계산 (더 예쁘게)
+        pos = self._get_layout(undirected_graph, k=2, iterations=100, seed=42)
+        
+        # 연결선 그리기 (관계 종류마다 선 하나로 묶기)
+        edge_traces = self._edge_style_traces(pos, self._drawn_edges(webgl), NETWORK_EDGE_STYLES,
+                                              scatter, customdata=True)
         
         # 학생들 점 그리기
         node_x = []
@@ -191,14 +835,14 @@ class FriendshipAnalyzer:
                            f'사교성: {sociability}명 언급함<br>'
                            f'💡 클릭하면 이 친구만 보여요!')
             
-            # 크기와 색깔 설정
-            size = max(30, popularity * 8 + 30)
+            # 크기와 색깔 설정 (WebGL이면 작게)
+            size = min(20, popularity + 6) if webgl else max(30, popularity * 8 + 30)
             node_sizes.append(size)
             node_colors.append(popularity)
         
-        node_trace = go.Scatter(
+        node_trace = scatter(
             x=node_x, y=node_y,
-            mode='markers+text',
+            mode='markers' if webgl else 'markers+text',
             text=node_text,
             textposition="middle center",
             textfont=dict(color='black', size=12, family="Arial Black"),  # 글자 색상 검은색으로 변경
@@ -210,7 +854,7 @@ class FriendshipAnalyzer:
                 colorscale='Viridis',
                 showscale=True,
                 colorbar=dict(title="인기도"),
-                line=dict(width=2, color='black')  # 테두리도 검은색
+                line=dict(width=1 if webgl else 2, color='black')  # 테두리도 검은색
             ),
             showlegend=False
         )
@@ -245,25 +889,20 @@ class FriendshipAnalyzer:
         
         return fig
     
-    def create_heatmap_network(self):
-        """인기도 히트맵 스타일 네트워크"""
+    def create_heatmap_network(self, render_mode='auto'):
+        """인기도 히트맵 스타일 네트워크 (render_mode는 create_network_visualization과 같아요)"""
         if self.graph is None:
             self.build_relationship_graph()
+        webgl = self._use_webgl(render_mode)
+        scatter = go.Scattergl if webgl else go.Scatter
         
         undirected_graph = self.graph.to_undirected()
-        pos = nx.spring_layout(undirected_graph, k=2, iterations=100, seed=42)
+        pos = self._get_layout(undirected_graph, k=2, iterations=100, seed=42)
         
         # 연결선
-        edge_x = []
-        edge_y = []
+        edge_x, edge_y = _edge_coordinates(pos, [edge[:2] for edge in self._drawn_edges(webgl)])
         
-        for edge in self.graph.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
-        
-        edge_trace = go.Scatter(
+        edge_trace = scatter(
             x=edge_x, y=edge_y,
             line=dict(width=1, color='lightgray'),
             hoverinfo='none',
@@ -285,14 +924,15 @@ class FriendshipAnalyzer:
             popularity = self.graph.in_degree(node)
             node_color.append(popularity)
         
-        node_trace = go.Scatter(
+        node_trace = scatter(
             x=node_x, y=node_y,
-            mode='markers+text',
+            mode='markers' if webgl else 'markers+text',
             text=node_text,
+            hoverinfo='text' if webgl else None,
             textposition="middle center",
             textfont=dict(color='white', size=12, family="Arial Black"),
             marker=dict(
-                size=40,
+                size=10 if webgl else 40,
                 color=node_color,
                 colorscale='Hot',
                 showscale=True,
@@ -316,38 +956,95 @@ class FriendshipAnalyzer:
         
         return fig
     
-    def create_group_colored_network(self):
-        """그룹별 색상 네트워크"""
+    def detect_communities(self, method='louvain', seed=42):
+        """친한 친구 그룹 찾기 (그래프가 바뀔 때까지 다시 써요)
+        
+        method는 'louvain', 'label_propagation', 'greedy_modularity' 중 하나예요.
+        그룹 번호는 학생 순서대로 처음 나온 그룹부터 0, 1, 2, ... 로 붙여요.
+        {'partition', 'modularity', 'method', 'seconds'} 를 돌려줘요.
+        """
+        if method not in COMMUNITY_METHODS:
+            raise ValueError(f"알 수 없는 그룹 찾기 방법이에요: {method}")
         if self.graph is None:
             self.build_relationship_graph()
         
-        undirected_graph = self.graph.to_undirected()
+        key = (self._graph_version, method, seed)
+        if key in self._communities:
+            return self._communities[key]
         
-        if HAS_COMMUNITY and len(undirected_graph.nodes()) > 0:
+        start = time.perf_counter()
+        undirected_graph = self.graph.to_undirected()
+        groups = None
+        if len(undirected_graph.nodes()) > 0:
             try:
-                partition = community_louvain.best_partition(undirected_graph)
-            except:
-                partition = {student: i % 5 for i, student in enumerate(self.students)}
-        else:
+                if method == 'louvain':
+                    if HAS_COMMUNITY:
+                        found = community_louvain.best_partition(undirected_graph, random_state=seed)
+                        groups = {}
+                        for student, group in found.items():
+                            groups.setdefault(group, set()).add(student)
+                        groups = list(groups.values())
+                    else:
+                        groups = nx.community.louvain_communities(undirected_graph, seed=seed)
+                elif method == 'label_propagation':
+                    groups = nx.community.asyn_lpa_communities(undirected_graph, weight='weight', seed=seed)
+                else:
+                    groups = nx.community.greedy_modularity_communities(undirected_graph, weight='weight')
+                groups = [set(group) for group in groups]
+            except Exception:
+                groups = None
+        
+        if groups is None:
+            # 에러가 나거나 학생이 없으면 간단하게 5개 그룹으로 나누기
             partition = {student: i % 5 for i, student in enumerate(self.students)}
+            modularity = None
+        else:
+            # 학생 순서대로 그룹 번호 다시 붙이기
+            group_of = {}
+            for index, group in enumerate(groups):
+                for student in group:
+                    group_of[student] = index
+            labels = {}
+            partition = {}
+            for student in undirected_graph.nodes():
+                partition[student] = labels.setdefault(group_of[student], len(labels))
+            try:
+                modularity = nx.community.modularity(undirected_graph, groups)
+            except Exception:
+                modularity = None
+        
+        result = {
+            'partition': partition,
+            'modularity': modularity,
+            'method': method,
+            'seconds': time.perf_counter() - start
+        }
+        # 예전 그래프의 결과는 지우기
+        self._communities = {k: v for k, v in self._communities.items() if k[0] == self._graph_version}
+        self._communities[key] = result
+        return result
+    
+    def create_group_colored_network(self, render_mode='auto'):
+        """그룹별 색상 네트워크 (render_mode는 create_network_visualization과 같아요)"""
+        if self.graph is None:
+            self.build_relationship_graph()
+        webgl = self._use_webgl(render_mode)
+        scatter = go.Scattergl if webgl else go.Scatter
+        
+        undirected_graph = self.graph.to_undirected()
+        
+        partition = self.detect_communities()['partition']
         
-        pos = nx.spring_layout(undirected_graph, k=2, iterations=100, seed=42)
+        pos = self._get_layout(undirected_graph, k=2, iterations=100, seed=42)
         
         colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8']
         
         traces = []
         
         # 연결선
-        edge_x = []
-        edge_y = []
-        
-        for edge in self.graph.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
+        edge_x, edge_y = _edge_coordinates(pos, [edge[:2] for edge in self._drawn_edges(webgl)])
         
-        edge_trace = go.Scatter(
+        edge_trace = scatter(
             x=edge_x, y=edge_y,
             line=dict(width=1, color='lightgray'),
             hoverinfo='none',
@@ -377,17 +1074,18 @@ class FriendshipAnalyzer:
             
             if node_x:
                 color = colors[group_idx % len(colors)]
-                node_trace = go.Scatter(
+                node_trace = scatter(
                     x=node_x, y=node_y,
-                    mode='markers+text',
+                    mode='markers' if webgl else 'markers+text',
                     text=node_text,
+                    hoverinfo='text' if webgl else None,
                     textposition="middle center",
                     textfont=dict(color='black', size=11, family="Arial Black"),
                     name=f'그룹 {group_idx + 1}',
                     marker=dict(
-                        size=35,
+                        size=10 if webgl else 35,
                         color=color,
-                        line=dict(width=2, color='white')
+                        line=dict(width=1 if webgl else 2, color='white')
                     )
                 )
                 traces.append(node_trace)
@@ -412,7 +1110,7 @@ class FriendshipAnalyzer:
             self.build_relationship_graph()
         
         undirected_graph = self.graph.to_undirected()
-        pos_2d = nx.spring_layout(undirected_graph, k=2, iterations=100, seed=42)
+        pos_2d = self._get_layout(undirected_graph, k=2, iterations=100, seed=42)
         
         # 3D 좌표 생성
         pos_3d = {}
@@ -488,48 +1186,25 @@ class FriendshipAnalyzer:
         
         return fig
     
-    def create_force_directed_network(self):
-        """힘-기반 레이아웃 네트워크"""
+    def create_force_directed_network(self, render_mode='auto'):
+        """힘-기반 레이아웃 네트워크 (render_mode는 create_network_visualization과 같아요)"""
         if self.graph is None:
             self.build_relationship_graph()
+        webgl = self._use_webgl(render_mode)
+        scatter = go.Scattergl if webgl else go.Scatter
         
         undirected_graph = self.graph.to_undirected()
-        try:
-            pos = nx.kamada_kawai_layout(undirected_graph)
-        except:
-            pos = nx.spring_layout(undirected_graph, k=3, iterations=200, seed=42)
-        
-        # 연결선
-        edge_traces = []
+        if self._resolve_layout_engine(undirected_graph) == 'fast':
+            pos = self._get_layout(undirected_graph, k=3, iterations=200, seed=42)
+        else:
+            try:
+                pos = self._get_layout(undirected_graph, 'kamada_kawai')
+            except (ValueError, nx.NetworkXException):
+                # 안 좋은 관계(음수 점수)가 있으면 kamada_kawai는 거리를 계산하지 못해요
+                pos = self._get_layout(undirected_graph, k=3, iterations=200, seed=42)
         
-        for edge in self.graph.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            
-            weight = self.graph[edge[0]][edge[1]].get('weight', 1)
-            
-            if weight > 4:
-                color = 'red'
-                width = 3
-            elif weight > 2:
-                color = 'blue'
-                width = 2
-            elif weight > 0:
-                color = 'green'
-                width = 1
-            else:
-                color = 'orange'
-                width = 1
-            
-            edge_trace = go.Scatter(
-                x=[x0, x1, None], 
-                y=[y0, y1, None],
-                mode='lines',
-                line=dict(width=width, color=color),
-                hoverinfo='none',
-                showlegend=False
-            )
-            edge_traces.append(edge_trace)
+        # 연결선 (관계 종류마다 선 하나로 묶기)
+        edge_traces = self._edge_style_traces(pos, self._drawn_edges(webgl), FORCE_EDGE_STYLES, scatter)
         
         # 노드
         node_x = []
@@ -544,12 +1219,13 @@ class FriendshipAnalyzer:
             node_text.append(node)
             
             degree = undirected_graph.degree(node)
-            node_sizes.append(max(20, degree * 5 + 20))
+            node_sizes.append(min(20, degree + 6) if webgl else max(20, degree * 5 + 20))
         
-        node_trace = go.Scatter(
+        node_trace = scatter(
             x=node_x, y=node_y,
-            mode='markers+text',
+            mode='markers' if webgl else 'markers+text',
             text=node_text,
+            hoverinfo='text' if webgl else None,
             textposition="middle center",
             textfont=dict(color='black', size=10, family="Arial Black"),
             marker=dict(
@@ -597,7 +1273,7 @@ class FriendshipAnalyzer:
             mutual_graph.add_edge(edge[0], edge[1], weight=edge[2])
         
         # 위치 계산
-        pos = nx.spring_layout(mutual_graph, k=3, iterations=150, seed=42)
+        pos = self._get_layout(mutual_graph, view='mutual', k=3, iterations=150, seed=42)
         
         # 연결선 그리기
         edge_x = []
@@ -683,20 +1359,8 @@ class FriendshipAnalyzer:
         # 무방향 그래프로 변환
         undirected_graph = self.graph.to_undirected()
         
-        # 그룹 찾기 (커뮤니티 탐지)
-        if HAS_COMMUNITY and len(undirected_graph.nodes()) > 0:
-            try:
-                partition = community_louvain.best_partition(undirected_graph)
-            except:
-                # 에러가 나면 간단하게 그룹 나누기
-                partition = {}
-                for i, student in enumerate(self.students):
-                    partition[student] = i % 5  # 5개 그룹으로 나누기
-        else:
-            # 커뮤니티 패키지가 없으면 간단하게 나누기
-            partition = {}
-            for i, student in enumerate(self.students):
-                partition[student] = i % 5  # 5개 그룹으로 나누기
+        # 그룹 찾기 (커뮤니티 탐지, 다른 그림과 같은 결과를 함께 써요)
+        partition = self.detect_communities()['partition']
         
         # 예쁜 색깔들 (첨부 이미지 참고)
         colors = [
@@ -844,6 +1508,89 @@ class FriendshipAnalyzer:
         
         return fig
     
+    def _get_relations(self):
+        """모든 학생의 나가는/들어오는 관계를 선을 한 번만 훑어서 정리하기
+        
+        그래프가 바뀔 때까지 다시 써요. 선은 보낸 학생 순서대로 나오기 때문에
+        들어오는 관계도 학생 순서대로 쌓여요.
+        """
+        if self._relations is None or self._relations[0] != self._graph_version:
+            outgoing = {node: [] for node in self.graph.nodes()}
+            incoming = {node: [] for node in self.graph.nodes()}
+            for source, target, weight in self.graph.edges(data='weight', default=1):
+                outgoing[source].append((target, weight))
+                incoming[target].append((source, weight))
+            self._relations = (self._graph_version, outgoing, incoming)
+        return self._relations[1], self._relations[2]
+    
+    def _use_sparse(self):
+        return self.backend == 'sparse' and HAS_SCIPY
+    
+    def to_sparse_adjacency(self):
+        """관계 그래프를 희소 행렬(CSR)로 바꾸기
+        
+        (행렬, 학생 순서) 를 돌려줘요. 행렬[i, j]는 i번 학생이 j번 학생에게 준 점수이고,
+        학생 순서는 그래프의 학생 순서 그대로예요. 그래프가 바뀔 때까지 다시 써요.
+        """
+        if not HAS_SCIPY:
+            raise ImportError("희소 행렬 계산에는 scipy가 필요해요.")
+        if self.graph is None:
+            self.build_relationship_graph()
+        
+        if self._sparse is None or self._sparse[0] != self._graph_version:
+            nodes = list(self.graph.nodes())
+            index = {node: i for i, node in enumerate(nodes)}
+            edges = list(self.graph.edges(data='weight', default=1))
+            rows = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=len(edges))
+            cols = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=len(edges))
+            weights = np.fromiter((w for _, _, w in edges), dtype=float, count=len(edges))
+            # 점수 합이 0인 관계도 선은 있으므로 0도 그대로 저장해요
+            matrix = sp.csr_matrix((weights, (rows, cols)), shape=(len(nodes), len(nodes)))
+            self._sparse = (self._graph_version, matrix, nodes)
+        return self._sparse[1], self._sparse[2]
+    
+    def get_sparse_metrics(self):
+        """희소 행렬로 학생별 관계 숫자 한꺼번에 계산하기
+        
+        받은/보낸 관계 수, 서로 언급한 수, 좋은/안 좋은 관계 수, 두 다리 안에 닿는 친구 수와
+        반 전체 상호성(reciprocity)을 돌려줘요.
+        """
+        matrix, nodes = self.to_sparse_adjacency()
+        if self._sparse_metrics is not None and self._sparse_metrics[0] == self._graph_version:
+            return self._sparse_metrics[1]
+        
+        # 선이 있으면 1 (점수와 상관없이)
+        linked = matrix.copy()
+        linked.data = np.ones_like(linked.data)
+        positive = linked.multiply(matrix > 0).tocsr()
+        negative = (linked - positive).tocsr()
+        mutual = linked.multiply(linked.T).tocsr()
+        
+        # 두 다리 안에 닿는 친구 (자기 자신은 빼기)
+        reach = (linked + linked @ linked).tocsr()
+        reach.setdiag(0)
+        reach.eliminate_zeros()
+        
+        def per_student(values):
+            values = np.asarray(values).ravel()
+            return {node: int(value) for node, value in zip(nodes, values)}
+        
+        metrics = {
+            'in_degree': per_student(linked.sum(axis=0)),
+            'out_degree': per_student(linked.sum(axis=1)),
+            'mutual_counts': per_student(mutual.sum(axis=1)),
+            # 내가 좋게 언급했고 상대도 나를 언급한 친구 수 (개별 분석의 서로 친구)
+            'mutual_friend_counts': per_student(positive.multiply(linked.T).sum(axis=1)),
+            'positive_out': per_student(positive.sum(axis=1)),
+            'negative_out': per_student(negative.sum(axis=1)),
+            'positive_in': per_student(positive.sum(axis=0)),
+            'negative_in': per_student(negative.sum(axis=0)),
+            'two_hop_reach': per_student(np.diff(reach.indptr)),
+            'reciprocity': mutual.nnz / linked.nnz if linked.nnz else 0.0
+        }
+        self._sparse_metrics = (self._graph_version, metrics)
+        return metrics
+    
     def get_individual_student_analysis(self, student_name):
         """개별 학생 분석 결과"""
         if self.graph is None:
@@ -852,73 +1599,28 @@ class FriendshipAnalyzer:
         if student_name not in self.students:
             return None
         
-        analysis = {}
-        
-        # 긍정적인 관계 (weight > 0)
-        positive_friends = []
-        negative_friends = []
-        
-        # 나가는 관계 (이 학생이 언급한 친구들)
-        for neighbor in self.graph.neighbors(student_name):
-            weight = self.graph[student_name][neighbor].get('weight', 1)
-            if weight > 0:
-                positive_friends.append((neighbor, weight))
-            else:
-                negative_friends.append((neighbor, abs(weight)))
-        
-        # 들어오는 관계 (이 학생을 언급한 친구들)
-        mentioned_by = []
-        for node in self.graph.nodes():
-            if self.graph.has_edge(node, student_name):
-                weight = self.graph[node][student_name].get('weight', 1)
-                mentioned_by.append((node, weight))
-        
-        # 인기도 계산
-        popularity_score = self.graph.in_degree(student_name)
-        sociability_score = self.graph.out_degree(student_name)
-        
-        # 상호 관계 (서로 언급한 경우)
-        mutual_friends = []
-        for friend, _ in positive_friends:
-            if self.graph.has_edge(friend, student_name):
-                mutual_friends.append(friend)
-        
-        analysis = {
-            'positive_friends': sorted(positive_friends, key=lambda x: x[1], reverse=True),
-            'negative_friends': sorted(negative_friends, key=lambda x: x[1], reverse=True),
-            'mentioned_by': sorted(mentioned_by, key=lambda x: x[1], reverse=True),
-            'mutual_friends': mutual_friends,
-            'popularity_score': popularity_score,
-            'sociability_score': sociability_score,
-            'is_popular': popularity_score >= len(self.students) * 0.3,  # 30% 이상이 언급하면 인기
-            'is_isolated': popularity_score <= 1,  # 1명 이하가 언급하면 고립
-            'is_low_mentioned': popularity_score <= 2  # 2명 이하가 언급
-        }
-        
-        return analysis
+        outgoing, incoming = self._get_relations()
+        return _StudentAnalysisView(self.students, outgoing, incoming).build(student_name)
     
     def get_class_overall_analysis(self):
         """반 전체 분석"""
         if self.graph is None:
             self.build_relationship_graph()
         
-        # 모든 학생별 분석
-        all_students_analysis = {}
-        for student in self.students:
-            all_students_analysis[student] = self.get_individual_student_analysis(student)
+        # 모든 학생별 분석 (필요한 학생만 그때그때 만들기)
+        outgoing, incoming = self._get_relations()
+        all_students_analysis = _StudentAnalysisView(self.students, outgoing, incoming)
+        popularity = {student: len(incoming[student]) for student in self.students}
         
         # 인기 학생들 (인기도 상위)
-        popularity_ranking = [(student, analysis['popularity_score']) 
-                            for student, analysis in all_students_analysis.items()]
+        popularity_ranking = list(popularity.items())
         popularity_ranking.sort(key=lambda x: x[1], reverse=True)
         
-        # 고립된 학생들
-        isolated_students = [student for student, analysis in all_students_analysis.items() 
-                           if analysis['is_isolated']]
+        # 고립된 학생들 (1명 이하가 언급)
+        isolated_students = [student for student, score in popularity.items() if score <= 1]
         
         # 적게 선택받은 학생들 (2명 이하)
-        low_mentioned_students = [student for student, analysis in all_students_analysis.items() 
-                                if analysis['is_low_mentioned'] and not analysis['is_isolated']]
+        low_mentioned_students = [student for student, score in popularity.items() if 1 < score <= 2]
         
         return {
             'popularity_ranking': popularity_ranking[:5],  # 상위 5명
@@ -974,6 +1676,33 @@ class FriendshipAnalyzer:
         
         return result
     
+    def get_betweenness_centrality(self):
+        """중간 역할 점수 (그래프가 바뀔 때까지 다시 써요)
+        
+        학생이 적으면 정확하게, 많으면 정해진 seed로 고른 일부 학생만 기준으로 근사해요.
+        """
+        if self.graph is None:
+            self.build_relationship_graph()
+        
+        mode = self.betweenness_mode
+        if mode not in BETWEENNESS_MODES:
+            raise ValueError(f"알 수 없는 중간 역할 점수 계산 방식이에요: {mode}")
+        key = (self._graph_version, mode)
+        if self._betweenness is not None and self._betweenness[0] == key:
+            return self._betweenness[1]
+        
+        n = self.graph.number_of_nodes()
+        if mode == 'auto':
+            mode = 'exact' if n <= BETWEENNESS_EXACT_MAX_NODES else 'approximate'
+        
+        if mode == 'approximate' and n > BETWEENNESS_SAMPLES:
+            betweenness = nx.betweenness_centrality(self.graph, k=BETWEENNESS_SAMPLES, seed=BETWEENNESS_SEED)
+        else:
+            betweenness = nx.betweenness_centrality(self.graph)
+        
+        self._betweenness = (key, betweenness)
+        return betweenness
+    
     def get_friendship_statistics(self):
         """친구관계 숫자로 살펴보기"""
         if self.graph is None:
@@ -982,9 +1711,18 @@ class FriendshipAnalyzer:
         stats = {}
         
         # 중요도 계산
-        stats['in_degree_centrality'] = nx.in_degree_centrality(self.graph)
-        stats['out_degree_centrality'] = nx.out_degree_centrality(self.graph)
-        stats['betweenness_centrality'] = nx.betweenness_centrality(self.graph)
+        if self._use_sparse():
+            metrics = self.get_sparse_metrics()
+            # networkx와 같은 방식 (관계 수 / (학생 수 - 1))
+            n = self.graph.number_of_nodes()
+            scale = 1 / (n - 1) if n > 1 else None
+            for key, degree in (('in_degree_centrality', metrics['in_degree']),
+                                ('out_degree_centrality', metrics['out_degree'])):
+                stats[key] = {node: d * scale if scale else 1 for node, d in degree.items()}
+        else:
+            stats['in_degree_centrality'] = nx.in_degree_centrality(self.graph)
+            stats['out_degree_centrality'] = nx.out_degree_centrality(self.graph)
+        stats['betweenness_centrality'] = self.get_betweenness_centrality()
         
         # 인기 학생 (많이 언급받은 학생)
         popular_students = sorted(stats['in_degree_centrality'].items(), 
@@ -0,0 +1,277 @@
+"""큰 반/학교 그래프용 빠른 레이아웃 (학생 위치 계산)
+
+1) 희소 행렬 스펙트럴 배치로 처음 위치를 잡고
+2) 격자로 근사한 힘-기반(Fruchterman-Reingold) 계산으로 다듬어요.
+
+학생이 많으면 밀어내는 힘을 격자 위 FFT 합성곱으로 한꺼번에 계산하기 때문에
+학생 수가 수천 명이어도 1초 안에 끝나요. seed가 같으면 항상 같은 위치가 나와요.
+"""
+import numpy as np
+
+try:
+    import scipy.sparse as sp
+    from scipy.sparse.linalg import eigsh
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+# 학생이 이보다 적으면 스펙트럴 배치를 밀집 행렬로 계산해요
+DENSE_SPECTRAL_MAX_NODES = 500
+DEFAULT_ITERATIONS = 50
+# 예전 위치에서 이어서 계산할 때(warm start) 반복 수와 처음 온도
+WARM_ITERATIONS = 15
+WARM_TEMPERATURE = 0.03
+# 학생이 이보다 적으면 밀어내는 힘을 모든 쌍에 대해 정확하게 계산해요
+EXACT_FORCE_MAX_NODES = 150
+# 같은 격자 칸 안에서 정확하게 계산하는 학생 쌍의 최대 수
+NEAR_PAIR_LIMIT = 2_000_000
+
+
+def _adjacency(n, edges):
+    """(i, j) 목록으로 대칭 인접 행렬 만들기 (선이 있으면 1)"""
+    if len(edges):
+        rows = np.concatenate([edges[:, 0], edges[:, 1]])
+        cols = np.concatenate([edges[:, 1], edges[:, 0]])
+    else:
+        rows = cols = np.zeros(0, dtype=np.int64)
+    matrix = sp.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n))
+    matrix.data[:] = 1.0  # 양쪽으로 적힌 선은 한 번만
+    return matrix
+
+
+def spectral_positions(n, edges, dim=2, seed=42):
+    """정규화 라플라시안의 작은 고유벡터로 처음 위치 잡기 (n x dim 배열)"""
+    rng = np.random.default_rng(seed)
+    if n <= dim + 1 or len(edges) == 0 or not HAS_SCIPY:
+        return rng.uniform(-1, 1, size=(n, dim))
+
+    adjacency = _adjacency(n, edges)
+    degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    inverse_sqrt = np.zeros(n)
+    inverse_sqrt[degree > 0] = 1 / np.sqrt(degree[degree > 0])
+    scale = sp.diags(inverse_sqrt)
+    # 2I - L = I + D^-1/2 A D^-1/2 의 큰 고유벡터 = L의 작은 고유벡터
+    shifted = sp.identity(n) + scale @ adjacency @ scale
+
+    if n <= DENSE_SPECTRAL_MAX_NODES:
+        _, vectors = np.linalg.eigh(shifted.toarray())
+        vectors = vectors[:, ::-1]
+    else:
+        _, vectors = eigsh(shifted, k=dim + 1, which='LA', v0=rng.uniform(0.5, 1.5, size=n))
+        vectors = vectors[:, ::-1]
+
+    # 가장 큰 고유벡터(모두 같은 방향)는 빼고 다음 dim개 사용
+    positions = vectors[:, 1:dim + 1] * np.sqrt(n)
+    # 고유벡터 부호를 정해서 항상 같은 그림이 나오게 하기
+    signs = np.sign(positions[np.argmax(np.abs(positions), axis=0), np.arange(dim)])
+    return positions * np.where(signs == 0, 1, signs)
+
+
+def _exact_forces(positions, k):
+    """모든 학생 쌍의 밀어내는 힘 (학생이 적을 때)"""
+    delta = positions[:, None, :] - positions[None, :, :]
+    distance2 = np.maximum((delta ** 2).sum(axis=2), 1e-9)
+    np.fill_diagonal(distance2, np.inf)
+    return ((k * k / distance2)[:, :, None] * delta).sum(axis=1)
+
+
+class _MeshForces:
+    """격자(mesh)에 학생을 뿌려 놓고 FFT 합성곱으로 밀어내는 힘 계산하기
+
+    학생마다 가까운 격자점들에 나눠 놓고(cloud-in-cell), 격자점 사이 힘 k²·r/|r|² 을
+    한 번에 더한 다음 다시 학생 위치로 읽어 와요. 학생 수와 상관없이 격자 크기만큼만 들어요.
+    """
+
+    def __init__(self, grid, dim):
+        self.grid = grid
+        self.dim = dim
+        self.shape = (2 * grid,) * dim
+        # 격자 한 칸 = 1 일 때의 힘 (-(grid-1) ~ grid-1 칸 떨어진 곳, FFT용으로 감아서 배치)
+        offsets = np.fft.fftfreq(2 * grid, 1 / (2 * grid))
+        offsets[grid] = 0  # 짝이 없는 가장 먼 칸은 쓰지 않기
+        axes = np.meshgrid(*([offsets] * dim), indexing='ij')
+        distance2 = sum(axis ** 2 for axis in axes)
+        distance2[distance2 == 0] = np.inf
+        self.kernels = [np.fft.rfftn(axis / distance2) for axis in axes]
+        self.corners = np.array(np.meshgrid(*([[0, 1]] * dim), indexing='ij')).reshape(dim, -1).T
+
+    def __call__(self, positions, k):
+        grid, dim = self.grid, self.dim
+        low = positions.min(axis=0)
+        spacing = max((positions.max(axis=0) - low).max(), 1e-9) / (grid - 1)
+        scaled = (positions - low) / spacing
+        base = np.minimum(np.floor(scaled).astype(np.int64), grid - 2)
+        fraction = scaled - base
+
+        # 학생을 가까운 격자점 2^dim개에 나눠 놓기
+        weights = []
+        cells = []
+        for corner in self.corners:
+            weights.append(np.prod(np.where(corner, fraction, 1 - fraction), axis=1))
+            cells.append(np.ravel_multi_index((base + corner).T, (grid,) * dim))
+        density = np.bincount(np.concatenate(cells), weights=np.concatenate(weights),
+                              minlength=grid ** dim).reshape((grid,) * dim)
+
+        density_fft = np.fft.rfftn(density, s=self.shape)
+        force = np.zeros_like(positions)
+        inner = (slice(0, grid),) * dim
+        for d, kernel in enumerate(self.kernels):
+            field = np.fft.irfftn(density_fft * kernel, s=self.shape)[inner].ravel()
+            for weight, cell in zip(weights, cells):
+                force[:, d] += weight * field[cell]
+        force *= k * k / spacing
+
+        # 격자로는 같은 칸 안의 학생끼리 잘 밀어내지 못하니 그 쌍은 정확하게 더하기
+        first, second = self._same_cell_pairs(np.ravel_multi_index(base.T, (grid,) * dim))
+        if len(first):
+            delta = positions[first] - positions[second]
+            distance2 = np.maximum((delta ** 2).sum(axis=1), 1e-9)
+            push = delta * (k * k / distance2)[:, None]
+            n = len(positions)
+            for d in range(dim):
+                force[:, d] += np.bincount(first, weights=push[:, d], minlength=n)
+                force[:, d] -= np.bincount(second, weights=push[:, d], minlength=n)
+        return force
+
+    @staticmethod
+    def _same_cell_pairs(cells):
+        """같은 칸에 있는 학생 쌍 (i, j) 목록 (너무 많으면 앞에서부터 NEAR_PAIR_LIMIT개)"""
+        order = np.argsort(cells, kind='stable')
+        sorted_cells = cells[order]
+        starts = np.flatnonzero(np.r_[True, sorted_cells[1:] != sorted_cells[:-1]])
+        ends = np.r_[starts[1:], len(cells)]
+        # 정렬된 자리마다 같은 칸의 뒤쪽 학생 수
+        group_end = np.repeat(ends, ends - starts)
+        counts = group_end - np.arange(len(cells)) - 1
+        total = counts.sum()
+        if total == 0:
+            return order[:0], order[:0]
+        if total > NEAR_PAIR_LIMIT:
+            counts = np.minimum(counts, max(1, NEAR_PAIR_LIMIT // len(cells)))
+            total = counts.sum()
+        first = np.repeat(np.arange(len(cells)), counts)
+        second = first + 1 + (np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts))
+        return order[first], order[second]
+
+
+def force_refine(positions, edges, iterations=DEFAULT_ITERATIONS, grid=None, seed=42,
+                 fixed=None, temperature=0.1):
+    """Fruchterman-Reingold로 위치 다듬기 (학생이 많으면 밀어내는 힘을 격자로 근사)
+
+    fixed(학생마다 True/False)를 주면 positions가 이미 [0, 1] 범위라고 보고
+    True인 학생은 움직이지 않아요.
+    """
+    positions = np.array(positions, dtype=float)
+    n, dim = positions.shape
+    if n < 2:
+        return positions
+
+    k = np.sqrt(1.0 / n)
+    jitter = np.random.default_rng(seed).uniform(-k / 2, k / 2, size=positions.shape)
+    if fixed is None:
+        # 위치를 [0, 1] 정도로 맞추고 시작 (너무 멀리 떨어진 몇 명 때문에 나머지가 뭉치지 않게)
+        positions -= np.median(positions, axis=0)
+        limit = np.percentile(np.abs(positions), 98)
+        positions = np.clip(positions / max(limit, 1e-9), -1, 1) * 0.5 + 0.5
+        # 같은 자리에서 시작한 학생들(스펙트럴 배치에서 구별이 안 되는 친구들)이 떨어질 수 있게 흔들기
+        positions += jitter
+    else:
+        moving = ~np.asarray(fixed, dtype=bool)
+        positions[moving] += jitter[moving]
+    if n <= EXACT_FORCE_MAX_NODES:
+        repulsion = _exact_forces
+    else:
+        if grid is None:
+            # 격자 한 칸이 학생 사이 거리(k)쯤 되도록
+            limit = 128 if dim == 2 else 32
+            grid = int(min(limit, 2 ** np.ceil(np.log2(2 * n ** (1 / dim)))))
+        repulsion = _MeshForces(grid, dim)
+
+    cooling = temperature / (iterations + 1)
+    for _ in range(iterations):
+        displacement = repulsion(positions, k)
+        if len(edges):
+            delta = positions[edges[:, 0]] - positions[edges[:, 1]]
+            distance = np.maximum(np.sqrt((delta ** 2).sum(axis=1)), 1e-9)
+            pull = delta * (distance / k)[:, None]
+            for d in range(dim):
+                displacement[:, d] -= np.bincount(edges[:, 0], weights=pull[:, d], minlength=n)
+                displacement[:, d] += np.bincount(edges[:, 1], weights=pull[:, d], minlength=n)
+        if fixed is not None:
+            displacement[~moving] = 0
+        length = np.maximum(np.sqrt((displacement ** 2).sum(axis=1)), 1e-9)
+        positions += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+    return positions
+
+
+def _rescale(positions, scale=1.0):
+    """가운데를 0으로, 가장 먼 좌표를 scale로 맞추기 (networkx 레이아웃과 같은 범위)"""
+    positions = positions - positions.mean(axis=0)
+    limit = np.abs(positions).max()
+    if limit > 0:
+        positions = positions * (scale / limit)
+    return positions
+
+
+def compute_layout(graph, dim=2, seed=42, iterations=DEFAULT_ITERATIONS, scale=1.0, pos=None, fixed=None):
+    """그래프 학생 위치 {학생: 좌표 배열} 계산하기
+
+    안 좋은 관계(점수 0 이하) 선은 끌어당기지 않아요.
+    pos(예전 위치)를 주면 그 위치에서 조금만 다듬고, fixed에 있는 학생은 그대로 둬요.
+    """
+    nodes = list(graph.nodes())
+    n = len(nodes)
+    if n == 0:
+        return {}
+    if n == 1:
+        return {nodes[0]: np.zeros(dim)}
+
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v, weight in graph.edges(data='weight', default=1)
+                      if u != v and weight > 0], dtype=np.int64).reshape(-1, 2)
+
+    if pos is not None:
+        return dict(zip(nodes, _warm_refine(nodes, edges, pos, set(fixed or ()), dim, seed, scale)))
+
+    positions = spectral_positions(n, edges, dim, seed)
+    positions = force_refine(positions, edges, iterations, seed=seed)
+    positions = _rescale(positions, scale)
+    return dict(zip(nodes, positions))
+
+
+def _warm_refine(nodes, edges, pos, fixed, dim, seed, scale):
+    """예전 위치(-scale ~ scale)에서 시작해 움직일 학생만 조금 다듬기
+
+    새로 들어온 학생은 이미 자리가 있는 친구들의 가운데에서 시작해요.
+    fixed 학생의 좌표는 그대로 돌려줘요 (범위를 다시 맞추지 않아요).
+    """
+    n = len(nodes)
+    positions = np.zeros((n, dim))
+    placed = np.zeros(n, dtype=bool)
+    for i, node in enumerate(nodes):
+        if node in pos:
+            positions[i] = np.asarray(pos[node], dtype=float)[:dim]
+            placed[i] = True
+
+    if not placed.all():
+        total = np.zeros((n, dim))
+        count = np.zeros(n)
+        for a, b in edges:
+            if placed[b]:
+                total[a] += positions[b]
+                count[a] += 1
+            if placed[a]:
+                total[b] += positions[a]
+                count[b] += 1
+        rng = np.random.default_rng(seed)
+        for i in np.flatnonzero(~placed):
+            positions[i] = total[i] / count[i] if count[i] else rng.uniform(-scale, scale, size=dim)
+
+    fixed_mask = np.array([placed[i] and node in fixed for i, node in enumerate(nodes)], dtype=bool)
+    # 레이아웃 범위(-scale ~ scale)를 force_refine이 쓰는 [0, 1]로 옮겼다가 되돌리기
+    refined = force_refine(positions / (2 * scale) + 0.5, edges, WARM_ITERATIONS, seed=seed,
+                           fixed=fixed_mask, temperature=WARM_TEMPERATURE)
+    refined = (refined - 0.5) * (2 * scale)
+    refined[fixed_mask] = positions[fixed_mask]
+    return refined
@@ -1,16 +1,29 @@
 import streamlit as st
 import pandas as pd
 import io
-import requests
+import os
 from urllib.parse import urlparse
-import re
 import base64
+import copy
+import threading
+import hashlib
+import json
 from datetime import datetime
 
 # 다른 모듈들
 from sample_data import generate_sample_data
-from friendship_analyzer import FriendshipAnalyzer
+from friendship_analyzer import FriendshipAnalyzer, dataset_hash
 from seating_optimizer import SeatingOptimizer
+import perf_monitor
+from sheet_fetcher import extract_file_id, fetch_sheet
+from figure_cache import get_figure_cache
+from report_builder import (
+    create_text_report, create_csv_report, create_markdown_report, create_html_report,
+    create_seating_csv, create_seating_text, create_seating_html
+)
+
+# 이보다 큰 파일은 나눠 읽기 (20MB)
+STREAM_UPLOAD_BYTES = 20 * 1024 * 1024
 
 def main():
     st.set_page_config(
@@ -28,8 +41,19 @@ def main():
         st.session_state.data = None
     if 'analyzer' not in st.session_state:
         st.session_state.analyzer = FriendshipAnalyzer()
+    if 'data_key' not in st.session_state:
+        st.session_state.data_key = None
     if 'seating_result' not in st.session_state:
         st.session_state.seating_result = None
+    
+    # 성능 측정 (켜면 이번 화면을 그리는 동안 걸린 시간을 기록해요)
+    show_perf = st.sidebar.toggle("⏱️ 성능 측정", value=False,
+                                  help="화면을 그릴 때 단계별로 걸린 시간을 보여줘요")
+    if show_perf:
+        perf_monitor.start_request()
+    else:
+        # 지난 실행이 중간에 멈춰서 측정이 켜진 채로 남았으면 끄기
+        perf_monitor.end_request()
 
     # 4개 탭으로 변경 (드롭다운 대신)
     tab1, tab2, tab3, tab4 = st.tabs([
@@ -39,17 +63,45 @@ def main():
         "💾 결과 내보내기"
     ])
     
-    with tab1:
-        show_data_upload_tab()
-    
-    with tab2:
-        show_analysis_tab()
-    
-    with tab3:
-        show_seating_tab()
-    
-    with tab4:
-        show_export_tab()
+    try:
+        with tab1:
+            show_data_upload_tab()
+        
+        with tab2:
+            show_analysis_tab()
+        
+        with tab3:
+            show_seating_tab()
+        
+        with tab4:
+            show_export_tab()
+    finally:
+        # 다시 실행(rerun)이나 멈춤으로 중간에 끝나도 측정은 꼭 끝내기
+        records = perf_monitor.end_request()
+    
+    if show_perf:
+        show_perf_panel(records)
+
+def show_perf_panel(records):
+    """이번 화면에서 단계별로 걸린 시간 보여주기"""
+    st.session_state.perf_log = records
+    with st.expander("⏱️ 성능", expanded=False):
+        if not records:
+            st.write("기록된 단계가 없어요. (저장해 둔 결과를 다시 쓰면 계산을 건너뛰어요)")
+            return
+        
+        summary = pd.DataFrame(perf_monitor.summarize(records))
+        summary = summary[['name', 'calls', 'total_ms', 'mean_ms', 'max_ms']]
+        summary.columns = ['단계', '호출 수', '전체 (ms)', '평균 (ms)', '최대 (ms)']
+        st.dataframe(summary.round(2), use_container_width=True, hide_index=True)
+        
+        st.caption("단계별 기록 (depth가 1 이상이면 다른 단계 안에서 불린 단계예요)")
+        st.json(records, expanded=False)
+
+def show_chart(fig):
+    """Plotly 그림 보여주기 (그림을 브라우저로 보내는 시간도 측정)"""
+    with perf_monitor.span('Plotly 그리기'):
+        st.plotly_chart(fig, use_container_width=True)
 
 def show_data_upload_tab():
     """설문 결과 올리기 탭"""
@@ -77,8 +129,7 @@ def show_data_upload_tab():
         
         if st.button("🎯 연습용 정보로 체험하기"):
             sample_df = generate_sample_data()
-            st.session_state.data = sample_df
-            st.session_state.analyzer.load_data(sample_df)
+            set_current_data(sample_df)
             st.success("✅ 연습용 정보를 불러왔어요!")
             st.dataframe(sample_df.head())
     
@@ -99,11 +150,16 @@ def show_data_upload_tab():
             
             if uploaded_file is not None:
                 try:
-                    df = pd.read_csv(uploaded_file, encoding='utf-8-sig')
-                    st.session_state.data = df
-                    st.session_state.analyzer.load_data(df)
-                    st.success(f"✅ 파일이 성공적으로 올라갔어요! ({len(df)}개 응답)")
-                    st.dataframe(df.head())
+                    if uploaded_file.size > STREAM_UPLOAD_BYTES:
+                        # 큰 파일은 필요한 컬럼만 나눠 읽기 (전체 표를 메모리에 두지 않아요)
+                        preview, responses = set_streamed_data(uploaded_file)
+                        st.success(f"✅ 큰 파일을 나눠서 읽었어요! ({responses}개 응답)")
+                        st.dataframe(preview)
+                    else:
+                        df = pd.read_csv(uploaded_file, encoding='utf-8-sig')
+                        set_current_data(df)
+                        st.success(f"✅ 파일이 성공적으로 올라갔어요! ({len(df)}개 응답)")
+                        st.dataframe(df.head())
                 except Exception as e:
                     st.error(f"❌ 파일을 읽는 중 문제가 생겼어요: {str(e)}")
         
@@ -119,20 +175,26 @@ def show_data_upload_tab():
                         # URL에서 파일 ID 추출
                         file_id = extract_file_id(sheet_url)
                         if file_id:
-                            csv_url = f"https://docs.google.com/spreadsheets/d/{file_id}/export?format=csv"
-                            
-                            # CSV 정보 가져오기
-                            response = requests.get(csv_url)
-                            response.raise_for_status()
-                            
-                            # CSV를 DataFrame으로 변환
-                            csv_content = response.content.decode('utf-8-sig')
-                            df = pd.read_csv(io.StringIO(csv_content))
+                            # CSV 정보 가져오기 (바뀌지 않았으면 저장해 둔 내용 사용)
+                            result = fetch_sheet(file_id)
+                            loaded = st.session_state.get('sheet_loaded')
                             
-                            st.session_state.data = df
-                            st.session_state.analyzer.load_data(df)
-                            st.success(f"✅ 구글시트 정보를 가져왔어요! ({len(df)}개 응답)")
-                            st.dataframe(df.head())
+                            if (loaded and loaded['content_hash'] == result['content_hash']
+                                    and loaded['data_key'] == st.session_state.data_key):
+                                # 내용이 그대로면 다시 읽거나 분석하지 않기
+                                st.info("✅ 구글시트 내용이 바뀌지 않았어요. 지금 분석 결과를 그대로 써요.")
+                            else:
+                                # CSV를 DataFrame으로 변환
+                                csv_content = result['content'].decode('utf-8-sig')
+                                df = pd.read_csv(io.StringIO(csv_content))
+                                
+                                set_current_data(df)
+                                st.session_state.sheet_loaded = {
+                                    'content_hash': result['content_hash'],
+                                    'data_key': st.session_state.data_key
+                                }
+                                st.success(f"✅ 구글시트 정보를 가져왔어요! ({len(df)}개 응답)")
+                                st.dataframe(df.head())
                         else:
                             st.error("❌ 올바른 구글시트 주소가 아니에요.")
                     else:
@@ -142,6 +204,103 @@ def show_data_upload_tab():
                     st.error(f"❌ 정보를 가져오는 중 문제가 생겼어요: {str(e)}")
                     st.write("💡 도움말: 구글시트 공유 설정을 '링크 있는 모든 사용자'로 바꿔주세요.")
 
+@st.cache_resource(max_entries=32, show_spinner=False)
+def load_analyzer(data_key, _df, _base=None, _base_key=None, _previous=None):
+    """설문 응답 하나에 분석기를 한 번만 만들어서 모든 사용자가 같이 쓰기
+    
+    _base가 있으면 (앞부분 응답이 같은 예전 분석기) 복사해서 새 응답만 추가해요.
+    _previous가 있으면 (같은 반의 예전 분석기) 그 그림 위치에서 이어서 그려요.
+    """
+    if _base is not None:
+        with analyzer_lock(_base_key):
+            analyzer = copy.deepcopy(_base)
+        analyzer.add_responses(_df.iloc[len(_base.data):])
+    else:
+        analyzer = FriendshipAnalyzer()
+        analyzer.load_data(_df)
+        if _previous is not None:
+            with analyzer_lock(_base_key):
+                analyzer.inherit_layouts(_previous)
+    
+    if analyzer.graph is None:
+        analyzer.build_relationship_graph()
+    return analyzer
+
+@st.cache_resource(max_entries=256, show_spinner=False)
+def analyzer_lock(data_key):
+    """같은 분석기를 여러 사용자가 동시에 고치지 않도록 잠그기"""
+    return threading.RLock()
+
+def set_current_data(df):
+    """새로 가져온 응답을 현재 정보로 정하기 (내용이 같으면 만들어 둔 분석기 사용)"""
+    previous = st.session_state.data
+    analyzer = st.session_state.analyzer
+    
+    # 앞부분이 그대로인 구글시트 새로고침이면 새 응답만 추가
+    base = None
+    same_class = (previous is not None and analyzer.data is not None
+                  and df.columns.equals(previous.columns))
+    if (same_class and len(df) > len(previous)
+            and df.iloc[:len(previous)].reset_index(drop=True).equals(previous.reset_index(drop=True))):
+        base = analyzer
+    
+    # 응답 몇 개만 고친 경우에는 예전 그림 위치에서 이어서 그리기
+    data_key = dataset_hash(df)
+    st.session_state.analyzer = load_analyzer(data_key, df, base, st.session_state.data_key,
+                                              analyzer if same_class and base is None else None)
+    st.session_state.data = df
+    st.session_state.data_key = data_key
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def load_streamed_analyzer(data_key, _file):
+    """큰 설문 파일을 나눠 읽어서 (분석기, 응답 수) 만들기 (파일 내용이 같으면 다시 쓰기)"""
+    analyzer = FriendshipAnalyzer()
+    responses = analyzer.load_data_stream(_file)
+    return analyzer, responses
+
+def set_streamed_data(uploaded_file):
+    """큰 파일을 현재 정보로 정하기 (미리보기 몇 줄만 보관)
+    
+    (미리보기, 응답 수) 를 돌려줘요.
+    """
+    digest = hashlib.sha1(uploaded_file.getbuffer())
+    data_key = f"stream-{digest.hexdigest()}"
+    analyzer, responses = load_streamed_analyzer(data_key, uploaded_file)
+    
+    uploaded_file.seek(0)
+    preview = pd.read_csv(uploaded_file, encoding='utf-8-sig', nrows=5)
+    st.session_state.analyzer = analyzer
+    st.session_state.data = preview
+    st.session_state.data_key = data_key
+    return preview, responses
+
+def build_figure(data_key, figure_name, analyzer):
+    """그래프 그림 가져오기
+    
+    디스크에 저장해 둔 그림(JSON)이 있으면 그대로 쓰고, 없을 때만 분석기가 만들어서 저장해요.
+    """
+    params = {'backend': analyzer.backend, 'layout_engine': analyzer.layout_engine}
+    
+    def build_json():
+        with analyzer_lock(data_key):
+            return analyzer.get_figure_json(figure_name)
+    
+    with perf_monitor.span('그림 저장소'):
+        content, _ = get_figure_cache().get_or_build(data_key, figure_name, build_json, params)
+        return json.loads(content)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def get_overall_analysis(data_key, _analyzer):
+    """반 전체 분석은 설문 응답마다 한 번만 계산하기"""
+    with analyzer_lock(data_key):
+        return _analyzer.get_class_overall_analysis()
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def get_statistics(data_key, _analyzer):
+    """통계(중간 역할 점수 포함)는 설문 응답마다 한 번만 계산하기"""
+    with analyzer_lock(data_key):
+        return _analyzer.get_friendship_statistics()
+
 def show_analysis_tab():
     """친구 관계 살펴보기 탭"""
     st.header("🔍 친구 관계 살펴보기")
@@ -172,17 +331,17 @@ def show_analysis_tab():
         
         try:
             if network_style == "🎯 기본 네트워크 (관계별 색상)":
-                fig = st.session_state.analyzer.create_network_visualization()
+                fig = build_figure(st.session_state.data_key, 'network', st.session_state.analyzer)
             elif network_style == "🌡️ 인기도 히트맵 스타일":
-                fig = st.session_state.analyzer.create_heatmap_network()
+                fig = build_figure(st.session_state.data_key, 'heatmap', st.session_state.analyzer)
             elif network_style == "🎨 그룹별 색상 네트워크":
-                fig = st.session_state.analyzer.create_group_colored_network()
+                fig = build_figure(st.session_state.data_key, 'group_colored', st.session_state.analyzer)
             elif network_style == "📊 3D 네트워크 (입체적)":
-                fig = st.session_state.analyzer.create_3d_network()
+                fig = build_figure(st.session_state.data_key, '3d', st.session_state.analyzer)
             elif network_style == "⚡ 힘-기반 레이아웃":
-                fig = st.session_state.analyzer.create_force_directed_network()
+                fig = build_figure(st.session_state.data_key, 'force_directed', st.session_state.analyzer)
                 
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig)
             
             st.info("💡 **사용 방법**: 각 동그라미는 학생이고, 선은 친구관계를 나타내요. 동그라미가 클수록 인기가 많은 친구예요!")
             
@@ -204,8 +363,8 @@ def show_analysis_tab():
             if viz_type == "🤝 상호작용 관계도":
                 st.subheader("🤝 상호작용 관계도")
                 try:
-                    fig = st.session_state.analyzer.create_interactive_relationship_map()
-                    st.plotly_chart(fig, use_container_width=True)
+                    fig = build_figure(st.session_state.data_key, 'interactive', st.session_state.analyzer)
+                    show_chart(fig)
                     
                     st.info("💡 **설명**: 서로 친하다고 언급한 친구들만 보여줘요. 파란 선으로 연결된 친구들은 서로를 좋아해요!")
                     
@@ -215,8 +374,8 @@ def show_analysis_tab():
             elif viz_type == "🌈 집단별 컬러 구분 원형 관계도":
                 st.subheader("🌈 집단별 컬러 구분 원형 관계도")
                 try:
-                    fig = st.session_state.analyzer.create_circular_group_visualization()
-                    st.plotly_chart(fig, use_container_width=True)
+                    fig = build_figure(st.session_state.data_key, 'circular_group', st.session_state.analyzer)
+                    show_chart(fig)
                     
                     st.info("💡 **설명**: 친한 친구들끼리 같은 색깔로 그룹을 만들어서 원 모양으로 배치했어요. 같은 색깔 친구들은 서로 잘 어울려요!")
                     
@@ -226,8 +385,8 @@ def show_analysis_tab():
             elif viz_type == "📊 숫자로 보는 통계":
                 st.subheader("📊 숫자로 보는 통계")
                 try:
-                    fig = st.session_state.analyzer.create_statistics_charts()
-                    st.plotly_chart(fig, use_container_width=True)
+                    fig = build_figure(st.session_state.data_key, 'statistics', st.session_state.analyzer)
+                    show_chart(fig)
                     
                     st.info("💡 **설명**: 인기쟁이, 친절한 친구, 중간 역할을 하는 친구들을 숫자로 보여줘요!")
                     
@@ -247,7 +406,8 @@ def show_analysis_tab():
             if selected_student:
                 try:
                     # 개별 분석 결과 표시
-                    analysis_text = st.session_state.analyzer.create_individual_analysis_text(selected_student)
+                    with analyzer_lock(st.session_state.data_key):
+                        analysis_text = st.session_state.analyzer.create_individual_analysis_text(selected_student)
                     st.markdown(analysis_text)
                     
                 except Exception as e:
@@ -260,7 +420,7 @@ def show_analysis_tab():
         
         try:
             # 반 전체 분석 결과
-            overall_analysis = st.session_state.analyzer.get_class_overall_analysis()
+            overall_analysis = get_overall_analysis(st.session_state.data_key, st.session_state.analyzer)
             
             col1, col2 = st.columns(2)
             
@@ -369,15 +529,16 @@ def show_seating_tab():
     # 자리 배치 알고리즘 선택
     algorithm = st.selectbox(
         "배치 방법을 선택해주세요:",
-        ["🧬 똑똑한 방법 (유전 알고리즘)", "🏃‍♂️ 빠른 방법 (탐욕 알고리즘)"]
+        ["🧬 똑똑한 방법 (유전 알고리즘)", "🏃‍♂️ 빠른 방법 (탐욕 알고리즘)", "🔥 정해진 시간 안에 찾기 (담금질, 0.5초)", "🚀 여러 번 동시에 찾기 (병렬 유전 알고리즘)"]
     )
     
     if st.button("🎯 자리 배치 만들기"):
         try:
             with st.spinner("🔄 가장 좋은 자리 배치를 찾고 있어요..."):
                 # 그래프가 제대로 구축되어 있는지 확인
-                if st.session_state.analyzer.graph is None:
-                    st.session_state.analyzer.build_relationship_graph()
+                with analyzer_lock(st.session_state.data_key):
+                    if st.session_state.analyzer.graph is None:
+                        st.session_state.analyzer.build_relationship_graph()
                 
                 # 디버깅 정보
                 st.info(f"📝 학생 수: {len(st.session_state.analyzer.students)}명")
@@ -390,8 +551,16 @@ def show_seating_tab():
                 st.info(f"🏫 교실 설정: {layout}")
                 st.info(f"👥 배치할 학생들: {optimizer.students}")
                 
-                if "똑똑한" in algorithm:
-                    result = optimizer.optimize_seating_genetic(population_size=20, generations=50)
+                if "병렬" in algorithm:
+                    seating, score, runs = optimizer.optimize_seating_parallel(
+                        restarts=os.cpu_count() or 4, method='genetic',
+                        population_size=200, generations=200
+                    )
+                    st.info(f"🚀 {len(runs)}번 찾은 점수: " + ", ".join(f"{run['score']:.1f}" for run in runs))
+                elif "담금질" in algorithm:
+                    seating, score = optimizer.optimize_seating_annealing(time_budget_ms=500)
+                elif "똑똑한" in algorithm:
+                    result = optimizer.optimize_seating_genetic(population_size=200, generations=200)
                     if result and len(result) == 2:
                         seating, score = result
                     else:
@@ -465,8 +634,8 @@ def show_export_tab():
         if st.button("📈 친구관계 분석 보고서 만들기"):
             try:
                 # 분석 데이터 수집
-                stats = st.session_state.analyzer.get_friendship_statistics()
-                overall_analysis = st.session_state.analyzer.get_class_overall_analysis()
+                stats = get_statistics(st.session_state.data_key, st.session_state.analyzer)
+                overall_analysis = get_overall_analysis(st.session_state.data_key, st.session_state.analyzer)
                 
                 if export_format == "📄 텍스트 보고서 (.txt)":
                     report = create_text_report(stats, overall_analysis)
@@ -566,237 +735,5 @@ def show_export_tab():
         3. 구글 시트/문서에서 파일 열기
         """)
 
-# 보고서 생성 함수들
-def create_text_report(stats, overall_analysis):
-    """텍스트 보고서 생성"""
-    report = f"""# 우리 반 친구관계 분석 보고서
-생성일시: {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}
-
-## 📊 주요 통계
-- 총 학생 수: {overall_analysis['total_students']}명
-- 총 친구관계 수: {overall_analysis['total_connections']}개
-- 평균 친구관계: {overall_analysis['total_connections'] / overall_analysis['total_students'] if overall_analysis['total_students'] > 0 else 0:.1f}개/명
-
-## 🌟 인기쟁이 TOP 5
-"""
-    for i, (name, score) in enumerate(stats['popular_students'], 1):
-        report += f"{i}. {name} (점수: {score:.2f})\n"
-    
-    report += f"""
-## 🤝 친절한 친구 TOP 5
-"""
-    for i, (name, score) in enumerate(stats['kind_students'], 1):
-        report += f"{i}. {name} (점수: {score:.2f})\n"
-    
-    report += f"""
-## 🔗 중간역할 TOP 5
-"""
-    for i, (name, score) in enumerate(stats['bridge_students'], 1):
-        report += f"{i}. {name} (점수: {score:.2f})\n"
-    
-    if overall_analysis['isolated_students']:
-        report += f"""
-## 😢 관심이 필요한 친구들
-"""
-        for student in overall_analysis['isolated_students']:
-            report += f"- {student}\n"
-    
-    if overall_analysis['low_mentioned_students']:
-        report += f"""
-## 😐 조금 더 관심을 가져주면 좋을 친구들
-"""
-        for student in overall_analysis['low_mentioned_students']:
-            report += f"- {student}\n"
-    
-    return report
-
-def create_csv_report(stats, overall_analysis):
-    """CSV 데이터 생성"""
-    data = []
-    
-    # 인기도 랭킹
-    for i, (name, score) in enumerate(stats['popular_students'], 1):
-        data.append(['인기도', i, name, f'{score:.3f}'])
-    
-    # 친절함 랭킹
-    for i, (name, score) in enumerate(stats['kind_students'], 1):
-        data.append(['친절함', i, name, f'{score:.3f}'])
-    
-    # 중간역할 랭킹
-    for i, (name, score) in enumerate(stats['bridge_students'], 1):
-        data.append(['중간역할', i, name, f'{score:.3f}'])
-    
-    df = pd.DataFrame(data, columns=['분류', '순위', '학생명', '점수'])
-    return df.to_csv(index=False, encoding='utf-8-sig')
-
-def create_markdown_report(stats, overall_analysis):
-    """마크다운 보고서 생성"""
-    report = f"""# 📊 우리 반 친구관계 분석 보고서
-
-> 생성일시: {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}
-
-## 📈 주요 통계
-
-| 항목 | 값 |
-|------|-----|
-| 총 학생 수 | {overall_analysis['total_students']}명 |
-| 총 친구관계 수 | {overall_analysis['total_connections']}개 |
-| 평균 친구관계 | {overall_analysis['total_connections'] / overall_analysis['total_students'] if overall_analysis['total_students'] > 0 else 0:.1f}개/명 |
-
-## 🏆 랭킹
-
-### 🌟 인기쟁이 TOP 5
-| 순위 | 학생명 | 점수 |
-|------|--------|------|
-"""
-    for i, (name, score) in enumerate(stats['popular_students'], 1):
-        report += f"| {i} | {name} | {score:.2f} |\n"
-    
-    report += """
-### 🤝 친절한 친구 TOP 5
-| 순위 | 학생명 | 점수 |
-|------|--------|------|
-"""
-    for i, (name, score) in enumerate(stats['kind_students'], 1):
-        report += f"| {i} | {name} | {score:.2f} |\n"
-    
-    return report
-
-def create_html_report(stats, overall_analysis):
-    """HTML 보고서 생성"""
-    html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>친구관계 분석 보고서</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; }}
-        h1 {{ color: #2c3e50; }}
-        h2 {{ color: #34495e; }}
-        table {{ border-collapse: collapse; width: 100%; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-        .highlight {{ background-color: #e8f5e8; }}
-    </style>
-</head>
-<body>
-    <h1>📊 우리 반 친구관계 분석 보고서</h1>
-    <p><strong>생성일시:</strong> {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}</p>
-    
-    <h2>📈 주요 통계</h2>
-    <table>
-        <tr><th>항목</th><th>값</th></tr>
-        <tr><td>총 학생 수</td><td>{overall_analysis['total_students']}명</td></tr>
-        <tr><td>총 친구관계 수</td><td>{overall_analysis['total_connections']}개</td></tr>
-        <tr><td>평균 친구관계</td><td>{overall_analysis['total_connections'] / overall_analysis['total_students'] if overall_analysis['total_students'] > 0 else 0:.1f}개/명</td></tr>
-    </table>
-    
-    <h2>🌟 인기쟁이 TOP 5</h2>
-    <table>
-        <tr><th>순위</th><th>학생명</th><th>점수</th></tr>
-"""
-    
-    for i, (name, score) in enumerate(stats['popular_students'], 1):
-        html += f"        <tr><td>{i}</td><td>{name}</td><td>{score:.2f}</td></tr>\n"
-    
-    html += """
-    </table>
-</body>
-</html>
-"""
-    return html
-
-def create_seating_csv(seating_data):
-    """자리 배치 CSV 생성"""
-    seating = seating_data['seating']
-    layout = seating_data['layout']
-    
-    # 자리 배치를 매트릭스로 변환
-    seating_matrix = []
-    for r in range(layout['rows']):
-        row = []
-        for c in range(layout['cols']):
-            student = seating.get((r, c), "빈자리")
-            row.append(student)
-        seating_matrix.append(row)
-    
-    df = pd.DataFrame(seating_matrix, 
-                     columns=[f"열{i+1}" for i in range(layout['cols'])],
-                     index=[f"줄{i+1}" for i in range(layout['rows'])])
-    
-    return df.to_csv(encoding='utf-8-sig')
-
-def create_seating_text(seating_data):
-    """자리 배치 텍스트 생성"""
-    seating = seating_data['seating']
-    
-    text = f"""자리 배치 결과
-생성일시: {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}
-점수: {seating_data['score']:.2f}
-
-자리 배치 목록:
-"""
-    
-    for (row, col), student in seating.items():
-        text += f"({row+1}줄, {col+1}열): {student}\n"
-    
-    return text
-
-def create_seating_html(seating_data):
-    """자리 배치 HTML 표 생성"""
-    seating = seating_data['seating']
-    layout = seating_data['layout']
-    
-    html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>자리 배치표</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; }}
-        table {{ border-collapse: collapse; margin: 20px auto; }}
-        td {{ border: 2px solid #333; width: 80px; height: 60px; text-align: center; vertical-align: middle; }}
-        .student {{ background-color: #e8f5e8; font-weight: bold; }}
-        .empty {{ background-color: #f0f0f0; }}
-        h1 {{ text-align: center; }}
-    </style>
-</head>
-<body>
-    <h1>🪑 자리 배치표</h1>
-    <p style="text-align: center;">점수: {seating_data['score']:.2f} | 생성일시: {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}</p>
-    
-    <table>
-"""
-    
-    for r in range(layout['rows']):
-        html += "        <tr>\n"
-        for c in range(layout['cols']):
-            student = seating.get((r, c), "🪑")
-            css_class = "student" if student != "🪑" else "empty"
-            html += f'            <td class="{css_class}">{student}</td>\n'
-        html += "        </tr>\n"
-    
-    html += """
-    </table>
-</body>
-</html>
-"""
-    return html
-
-def extract_file_id(url):
-    """구글시트 URL에서 파일 ID 추출"""
-    patterns = [
-        r'/spreadsheets/d/([a-zA-Z0-9-_]+)',
-        r'id=([a-zA-Z0-9-_]+)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
-
 if __name__ == "__main__":
     main()
\ No newline at end of file
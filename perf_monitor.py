@@ -0,0 +1,110 @@
+"""가벼운 성능 측정 (구간별 걸린 시간 기록)
+
+요청(화면 한 번 그리기) 하나를 start_request()로 시작하면 그동안 불린 span/timed 구간이
+스레드마다 따로 기록돼요. 측정을 켜지 않은 스레드에서는 함수 한 번 더 부르는 정도만 들어요.
+
+    perf_monitor.start_request()
+    with perf_monitor.span('레이아웃'):
+        ...
+    records = perf_monitor.end_request()
+    perf_monitor.summarize(records)
+"""
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+
+_local = threading.local()
+
+
+def start_request():
+    """이 스레드에서 측정 시작하기 (끝내지 못한 이전 기록이 남아 있어도 지워요)"""
+    _local.records = []
+    _local.depth = 0
+    _local.started = time.perf_counter()
+
+
+def end_request():
+    """이 스레드의 측정을 끝내고 기록 목록 돌려주기"""
+    records = getattr(_local, 'records', None)
+    _local.records = None
+    return records or []
+
+
+def is_recording():
+    """이 스레드에서 측정 중인지"""
+    return getattr(_local, 'records', None) is not None
+
+
+@contextmanager
+def _recorded_span(records, name):
+    depth = _local.depth
+    _local.depth = depth + 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        _local.depth = depth
+        records.append({
+            'name': name,
+            'ms': (end - start) * 1000,
+            'start_ms': (start - _local.started) * 1000,
+            'depth': depth
+        })
+
+
+@contextmanager
+def _null_span():
+    yield
+
+
+def span(name):
+    """with 문으로 감싼 구간의 시간 재기 (측정 중이 아니면 아무것도 안 해요)"""
+    records = getattr(_local, 'records', None)
+    if records is None:
+        return _null_span()
+    return _recorded_span(records, name)
+
+
+def timed(name=None):
+    """함수 하나를 감싸서 불릴 때마다 시간 재기"""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            records = getattr(_local, 'records', None)
+            if records is None:
+                return func(*args, **kwargs)
+            with _recorded_span(records, label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instrument(cls):
+    """클래스의 공개 메서드 (밑줄로 시작하지 않는 것) 전부에 timed 붙이기"""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith('_') or not inspect.isfunction(value):
+            continue
+        setattr(cls, attr, timed(f"{cls.__name__}.{attr}")(value))
+    return cls
+
+
+def summarize(records):
+    """구간 이름별로 호출 수, 전체/평균/최대 밀리초 정리하기 (오래 걸린 순)"""
+    summary = {}
+    for record in records:
+        item = summary.setdefault(record['name'], {
+            'name': record['name'], 'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0
+        })
+        item['calls'] += 1
+        item['total_ms'] += record['ms']
+        item['max_ms'] = max(item['max_ms'], record['ms'])
+
+    rows = sorted(summary.values(), key=lambda item: item['total_ms'], reverse=True)
+    for item in rows:
+        item['mean_ms'] = item['total_ms'] / item['calls']
+    return rows
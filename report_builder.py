@@ -0,0 +1,224 @@
+"""분석 보고서와 자리 배치표 만들기
+
+Streamlit 없이도 쓸 수 있도록 화면(main_app.py)과 일괄 처리(batch_runner.py)가 함께 써요.
+"""
+import pandas as pd
+from datetime import datetime
+
+def create_text_report(stats, overall_analysis):
+    """텍스트 보고서 생성"""
+    report = f"""# 우리 반 친구관계 분석 보고서
+생성일시: {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}
+
+## 📊 주요 통계
+- 총 학생 수: {overall_analysis['total_students']}명
+- 총 친구관계 수: {overall_analysis['total_connections']}개
+- 평균 친구관계: {overall_analysis['total_connections'] / overall_analysis['total_students'] if overall_analysis['total_students'] > 0 else 0:.1f}개/명
+
+## 🌟 인기쟁이 TOP 5
+"""
+    for i, (name, score) in enumerate(stats['popular_students'], 1):
+        report += f"{i}. {name} (점수: {score:.2f})\n"
+    
+    report += f"""
+## 🤝 친절한 친구 TOP 5
+"""
+    for i, (name, score) in enumerate(stats['kind_students'], 1):
+        report += f"{i}. {name} (점수: {score:.2f})\n"
+    
+    report += f"""
+## 🔗 중간역할 TOP 5
+"""
+    for i, (name, score) in enumerate(stats['bridge_students'], 1):
+        report += f"{i}. {name} (점수: {score:.2f})\n"
+    
+    if overall_analysis['isolated_students']:
+        report += f"""
+## 😢 관심이 필요한 친구들
+"""
+        for student in overall_analysis['isolated_students']:
+            report += f"- {student}\n"
+    
+    if overall_analysis['low_mentioned_students']:
+        report += f"""
+## 😐 조금 더 관심을 가져주면 좋을 친구들
+"""
+        for student in overall_analysis['low_mentioned_students']:
+            report += f"- {student}\n"
+    
+    return report
+
+def create_csv_report(stats, overall_analysis):
+    """CSV 데이터 생성"""
+    data = []
+    
+    # 인기도 랭킹
+    for i, (name, score) in enumerate(stats['popular_students'], 1):
+        data.append(['인기도', i, name, f'{score:.3f}'])
+    
+    # 친절함 랭킹
+    for i, (name, score) in enumerate(stats['kind_students'], 1):
+        data.append(['친절함', i, name, f'{score:.3f}'])
+    
+    # 중간역할 랭킹
+    for i, (name, score) in enumerate(stats['bridge_students'], 1):
+        data.append(['중간역할', i, name, f'{score:.3f}'])
+    
+    df = pd.DataFrame(data, columns=['분류', '순위', '학생명', '점수'])
+    return df.to_csv(index=False, encoding='utf-8-sig')
+
+def create_markdown_report(stats, overall_analysis):
+    """마크다운 보고서 생성"""
+    report = f"""# 📊 우리 반 친구관계 분석 보고서
+
+> 생성일시: {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}
+
+## 📈 주요 통계
+
+| 항목 | 값 |
+|------|-----|
+| 총 학생 수 | {overall_analysis['total_students']}명 |
+| 총 친구관계 수 | {overall_analysis['total_connections']}개 |
+| 평균 친구관계 | {overall_analysis['total_connections'] / overall_analysis['total_students'] if overall_analysis['total_students'] > 0 else 0:.1f}개/명 |
+
+## 🏆 랭킹
+
+### 🌟 인기쟁이 TOP 5
+| 순위 | 학생명 | 점수 |
+|------|--------|------|
+"""
+    for i, (name, score) in enumerate(stats['popular_students'], 1):
+        report += f"| {i} | {name} | {score:.2f} |\n"
+    
+    report += """
+### 🤝 친절한 친구 TOP 5
+| 순위 | 학생명 | 점수 |
+|------|--------|------|
+"""
+    for i, (name, score) in enumerate(stats['kind_students'], 1):
+        report += f"| {i} | {name} | {score:.2f} |\n"
+    
+    return report
+
+def create_html_report(stats, overall_analysis):
+    """HTML 보고서 생성"""
+    html = f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>친구관계 분석 보고서</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 40px; }}
+        h1 {{ color: #2c3e50; }}
+        h2 {{ color: #34495e; }}
+        table {{ border-collapse: collapse; width: 100%; }}
+        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+        th {{ background-color: #f2f2f2; }}
+        .highlight {{ background-color: #e8f5e8; }}
+    </style>
+</head>
+<body>
+    <h1>📊 우리 반 친구관계 분석 보고서</h1>
+    <p><strong>생성일시:</strong> {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}</p>
+    
+    <h2>📈 주요 통계</h2>
+    <table>
+        <tr><th>항목</th><th>값</th></tr>
+        <tr><td>총 학생 수</td><td>{overall_analysis['total_students']}명</td></tr>
+        <tr><td>총 친구관계 수</td><td>{overall_analysis['total_connections']}개</td></tr>
+        <tr><td>평균 친구관계</td><td>{overall_analysis['total_connections'] / overall_analysis['total_students'] if overall_analysis['total_students'] > 0 else 0:.1f}개/명</td></tr>
+    </table>
+    
+    <h2>🌟 인기쟁이 TOP 5</h2>
+    <table>
+        <tr><th>순위</th><th>학생명</th><th>점수</th></tr>
+"""
+    
+    for i, (name, score) in enumerate(stats['popular_students'], 1):
+        html += f"        <tr><td>{i}</td><td>{name}</td><td>{score:.2f}</td></tr>\n"
+    
+    html += """
+    </table>
+</body>
+</html>
+"""
+    return html
+
+def create_seating_csv(seating_data):
+    """자리 배치 CSV 생성"""
+    seating = seating_data['seating']
+    layout = seating_data['layout']
+    
+    # 자리 배치를 매트릭스로 변환
+    seating_matrix = []
+    for r in range(layout['rows']):
+        row = []
+        for c in range(layout['cols']):
+            student = seating.get((r, c), "빈자리")
+            row.append(student)
+        seating_matrix.append(row)
+    
+    df = pd.DataFrame(seating_matrix, 
+                     columns=[f"열{i+1}" for i in range(layout['cols'])],
+                     index=[f"줄{i+1}" for i in range(layout['rows'])])
+    
+    return df.to_csv(encoding='utf-8-sig')
+
+def create_seating_text(seating_data):
+    """자리 배치 텍스트 생성"""
+    seating = seating_data['seating']
+    
+    text = f"""자리 배치 결과
+생성일시: {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}
+점수: {seating_data['score']:.2f}
+
+자리 배치 목록:
+"""
+    
+    for (row, col), student in seating.items():
+        text += f"({row+1}줄, {col+1}열): {student}\n"
+    
+    return text
+
+def create_seating_html(seating_data):
+    """자리 배치 HTML 표 생성"""
+    seating = seating_data['seating']
+    layout = seating_data['layout']
+    
+    html = f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>자리 배치표</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 40px; }}
+        table {{ border-collapse: collapse; margin: 20px auto; }}
+        td {{ border: 2px solid #333; width: 80px; height: 60px; text-align: center; vertical-align: middle; }}
+        .student {{ background-color: #e8f5e8; font-weight: bold; }}
+        .empty {{ background-color: #f0f0f0; }}
+        h1 {{ text-align: center; }}
+    </style>
+</head>
+<body>
+    <h1>🪑 자리 배치표</h1>
+    <p style="text-align: center;">점수: {seating_data['score']:.2f} | 생성일시: {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}</p>
+    
+    <table>
+"""
+    
+    for r in range(layout['rows']):
+        html += "        <tr>\n"
+        for c in range(layout['cols']):
+            student = seating.get((r, c), "🪑")
+            css_class = "student" if student != "🪑" else "empty"
+            html += f'            <td class="{css_class}">{student}</td>\n'
+        html += "        </tr>\n"
+    
+    html += """
+    </table>
+</body>
+</html>
+"""
+    return html
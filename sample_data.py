@@ -2,16 +2,46 @@ import pandas as pd
 import csv
 import io
 
-def generate_sample_data():
-    """구글폼 설문에 맞는 샘플 데이터 생성"""
+# 학생 수를 정하면 만드는 가짜 이름 재료
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_FIRST = "민서지도예하유수준시은채다태재승나주현우"
+GIVEN_SECOND = "수우연윤호린원빈민현진아율준희영서혁성은"
+
+def make_student_names(num_students):
+    """서로 다른 학생 이름 num_students개 만들기
+    
+    재료를 다 쓸 만큼 많으면 모든 이름에 같은 자릿수 번호를 붙여요
+    (김민수01, 김민수11 ...). 그래야 어떤 이름도 다른 이름 안에 들어 있지 않아서
+    친구 이름 찾기가 헷갈리지 않아요.
+    """
+    base_count = len(SURNAMES) * len(GIVEN_FIRST) * len(GIVEN_SECOND)
+    width = len(str((num_students - 1) // base_count)) if num_students > base_count else 0
+    names = []
+    for i in range(num_students):
+        surname = SURNAMES[i % len(SURNAMES)]
+        rest = i // len(SURNAMES)
+        name = surname + GIVEN_FIRST[rest % len(GIVEN_FIRST)] + GIVEN_SECOND[(rest // len(GIVEN_FIRST)) % len(GIVEN_SECOND)]
+        cycle = i // base_count
+        names.append(f"{name}{cycle:0{width}d}" if width else name)
+    return names
+
+def generate_sample_data(num_students=None, seed=None):
+    """구글폼 설문에 맞는 샘플 데이터 생성
+    
+    num_students를 주면 그만큼 가짜 이름으로 학생을 만들고,
+    seed를 주면 항상 같은 데이터가 나와요 (성능 측정용).
+    """
     
     # 샘플 학생 명단
-    students = [
-        "김민수", "이지우", "박서연", "최다혜", "정준호", 
-        "한지민", "강태완", "송유진", "윤서현", "임도현",
-        "오예린", "신재원", "배하늘", "조민기", "홍수빈",
-        "안지호", "권나연", "이승민", "박채원", "김도연"
-    ]
+    if num_students is None:
+        students = [
+            "김민수", "이지우", "박서연", "최다혜", "정준호", 
+            "한지민", "강태완", "송유진", "윤서현", "임도현",
+            "오예린", "신재원", "배하늘", "조민기", "홍수빈",
+            "안지호", "권나연", "이승민", "박채원", "김도연"
+        ]
+    else:
+        students = make_student_names(num_students)
     
     # 컬럼명 정의 (구글폼 질문에 맞춤)
     columns = [
@@ -34,19 +64,27 @@ def generate_sample_data():
     import random
     from datetime import datetime, timedelta
     
-    base_time = datetime.now() - timedelta(days=7)
+    if seed is None:
+        rng = random
+        base_time = datetime.now() - timedelta(days=7)
+    else:
+        rng = random.Random(seed)
+        base_time = datetime(2024, 3, 4, 9, 0, 0)
+    
+    num_others = len(students) - 1
+    
+    def pick_others(i, k):
+        # 자기 자신을 뺀 다른 학생 k명 (명단 전체를 다시 만들지 않고 번호로 고르기)
+        return [students[j + (j >= i)] for j in rng.sample(range(num_others), k)]
     
     for i, student in enumerate(students):
-        # 다른 학생들 목록 (자기 제외)
-        other_students = [s for s in students if s != student]
-        
         # 랜덤하게 친구 관계 생성
-        close_friends = random.sample(other_students, min(3, len(other_students)))
-        frequent_friends = random.sample(other_students, random.randint(2, 6))
-        help_friend = random.choice(other_students)
-        helped_friends = random.sample(other_students, random.randint(1, 4))
-        conflict_friends = random.sample(other_students, random.randint(0, 2)) if random.random() > 0.7 else []
-        want_close_friends = random.sample(other_students, random.randint(1, 3))
+        close_friends = pick_others(i, min(3, num_others))
+        frequent_friends = pick_others(i, min(rng.randint(2, 6), num_others))
+        help_friend = pick_others(i, 1)[0] if num_others else ""
+        helped_friends = pick_others(i, min(rng.randint(1, 4), num_others))
+        conflict_friends = pick_others(i, min(rng.randint(0, 2), num_others)) if rng.random() > 0.7 else []
+        want_close_friends = pick_others(i, min(rng.randint(1, 3), num_others))
         
         row_data = [
             (base_time + timedelta(hours=i*2)).strftime("%Y/%m/%d %H:%M:%S"),
@@ -57,9 +95,9 @@ def generate_sample_data():
             ", ".join(helped_friends),
             ", ".join(conflict_friends) if conflict_friends else "",
             ", ".join(want_close_friends),
-            random.randint(3, 5),
-            random.randint(3, 5),
-            f"{student}의 교우관계에 대한 의견입니다." if random.random() > 0.5 else ""
+            rng.randint(3, 5),
+            rng.randint(3, 5),
+            f"{student}의 교우관계에 대한 의견입니다." if rng.random() > 0.5 else ""
         ]
         
         sample_data.append(row_data)
@@ -7,13 +7,47 @@ from itertools import combinations
 import random
 from typing import List, Tuple, Dict
 import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import perf_monitor
 
+# 점수를 더하고 빼는 순서 때문에 생기는 아주 작은 차이는 같은 점수로 보기
+SCORE_TOLERANCE = 1e-9
+
+# 자리 사이 거리를 표로 미리 계산해 둘 최대 칸 수 (더 크면 좌표로 바로 계산)
+DISTANCE_MATRIX_MAX_SLOTS = 2048
+
+# 병렬 탐색에서 고를 수 있는 배치 방법
+SEARCH_METHODS = ('genetic', 'greedy', 'annealing')
+
+# 병렬 탐색에서 작업 프로세스마다 한 번만 만드는 자리 배치 도우미
+_worker_optimizer = None
+
+def _init_search_worker(students, edges, rows, cols, teacher_position):
+    """작업 프로세스 준비하기 (관계 그래프는 학생 목록과 선 목록으로 한 번만 받기)"""
+    global _worker_optimizer
+    graph = nx.DiGraph()
+    graph.add_nodes_from(students)
+    graph.add_weighted_edges_from(edges)
+    
+    _worker_optimizer = SeatingOptimizer(graph)
+    _worker_optimizer.create_classroom_layout(rows, cols, teacher_position)
+
+def _run_search(method, seed, options):
+    """시작점 하나로 자리 배치 찾기 (작업 프로세스에서 실행)"""
+    start = time.perf_counter()
+    seating, score = _worker_optimizer._search_once(method, seed, options)
+    return seating, score, time.perf_counter() - start
+
+@perf_monitor.instrument
 class SeatingOptimizer:
     def __init__(self, friendship_graph=None):
         self.graph = friendship_graph
         self.students = []
         self.classroom_layout = None
         self.current_seating = None
+        self._scoring = None
         
         # 그래프가 있으면 학생 목록 설정
         if friendship_graph is not None:
@@ -23,6 +57,7 @@ class SeatingOptimizer:
         """친구 관계 그래프 설정하기"""
         self.graph = graph
         self.students = list(graph.nodes())
+        self._scoring = None
         
     def create_classroom_layout(self, rows, cols, teacher_position='front'):
         """교실 배치 만들기"""
@@ -32,6 +67,7 @@ class SeatingOptimizer:
             'total_seats': rows * cols,
             'teacher_position': teacher_position
         }
+        self._scoring = None
         
         # 자리 위치 만들기 (세로줄, 가로줄) 형태
         self.seat_positions = []
@@ -62,43 +98,191 @@ class SeatingOptimizer:
         if not self.graph or not seating_arrangement:
             return 0
         
-        total_score = 0
-        student_positions = {student: pos for pos, student in seating_arrangement.items()}
-        
-        # 친한 친구들 간의 거리 고려하기
-        for student1, student2 in self.graph.edges():
-            if student1 in student_positions and student2 in student_positions:
-                pos1 = student_positions[student1]
-                pos2 = student_positions[student2]
-                distance = self.calculate_distance(pos1, pos2)
-                
-                # 관계 점수 가져오기
-                weight = self.graph[student1][student2].get('weight', 1)
-                
-                # 좋은 관계는 가까이, 안 좋은 관계는 멀리
-                if weight > 0:
-                    # 가까울수록 높은 점수 (좋은 관계)
-                    score = weight * (1 / (1 + distance))
-                else:
-                    # 멀수록 높은 점수 (안 좋은 관계)
-                    score = abs(weight) * distance
-                
-                total_score += score
+        return float(self._score_seat_of(self._seating_to_seat_of(seating_arrangement)))
+    
+    def _prepare_scoring(self):
+        """점수 계산에 쓸 배열을 한 번만 만들기
         
-        # 선생님과의 거리 고려하기 (집중이 필요한 학생을 앞자리에)
-        teacher_position = self.get_teacher_position()
-        for student, position in student_positions.items():
-            distance_to_teacher = self.calculate_distance(position, teacher_position)
+        학생과 자리를 번호로 바꾸고, 자리 사이 거리와 선생님까지의 거리를 미리
+        계산해 둬요. 배치는 '칸 -> 학생 번호' 순열로 나타내요. 칸은
+        max(자리 수, 학생 수)개이고, 자리 수 이상인 칸은 자리를 못 받은 학생,
+        학생 수 이상인 번호는 빈자리예요.
+        """
+        if self._scoring is None:
+            students = list(self.graph.nodes())
+            index = {student: i for i, student in enumerate(students)}
+            n_students = len(students)
+            n_seats = len(self.seat_positions)
+            n_slots = max(n_seats, n_students)
+            
+            edges = list(self.graph.edges(data='weight', default=1))
+            src = np.array([index[u] for u, _, _ in edges], dtype=np.intp)
+            dst = np.array([index[v] for _, v, _ in edges], dtype=np.intp)
+            weight = np.array([w for _, _, w in edges], dtype=float)
+            
+            # 자리 좌표 (자리가 아닌 칸은 0으로 채우고 점수 계산에서 빼요)
+            coords = np.zeros((n_slots + 1, 2))
+            coords[:n_seats] = np.array(self.seat_positions, dtype=float).reshape(-1, 2)
+            
+            seat_distance = None
+            if n_slots + 1 <= DISTANCE_MATRIX_MAX_SLOTS:
+                diff = coords[:, None, :] - coords[None, :, :]
+                seat_distance = np.sqrt((diff ** 2).sum(axis=-1))
+            
+            # 선생님과의 거리에 따른 점수 (도움 주는 학생은 중간에, 받는 학생은 앞쪽에)
+            teacher_distance = np.sqrt(((coords - np.array(self.get_teacher_position(), dtype=float)) ** 2).sum(axis=1))
+            helper_score = 0.5 * (1 / (1 + np.abs(teacher_distance - 2)))
+            receiver_score = 0.3 * (1 / (1 + teacher_distance))
+            helper_score[n_seats:] = 0
+            receiver_score[n_seats:] = 0
+            
+            in_degree = np.bincount(dst, minlength=n_students)
+            out_degree = np.bincount(src, minlength=n_students)
+            
+            # 학생마다 이어진 선 번호 (나가는 선 + 들어오는 선)
+            endpoints = np.concatenate([src, dst])
+            order = np.argsort(endpoints, kind='stable')
+            incident_edges = np.concatenate([np.arange(len(edges))] * 2)[order]
+            incident_ptr = np.concatenate([[0], np.cumsum(np.bincount(endpoints, minlength=n_students))])
             
-            # 학생의 특성에 따라 점수 주기 (예: 도움이 필요한 학생)
-            if self.graph.in_degree(student) < self.graph.out_degree(student):
-                # 도움을 많이 주는 학생은 중간에
-                total_score += 0.5 * (1 / (1 + abs(distance_to_teacher - 2)))
-            elif self.graph.in_degree(student) > self.graph.out_degree(student):
-                # 도움을 많이 받는 학생은 앞쪽에
-                total_score += 0.3 * (1 / (1 + distance_to_teacher))
-        
-        return total_score
+            self._scoring = {
+                'students': students,
+                'index': index,
+                'n_students': n_students,
+                'n_seats': n_seats,
+                'n_slots': n_slots,
+                'seat_index': {pos: i for i, pos in enumerate(self.seat_positions)},
+                'src': src,
+                'dst': dst,
+                'weight': weight,
+                'coords': coords,
+                'seat_distance': seat_distance,
+                'role': np.sign(out_degree - in_degree),  # 1: 도움 주는 학생, -1: 도움 받는 학생
+                'helper_score': helper_score,
+                'receiver_score': receiver_score,
+                'incident_edges': incident_edges,
+                'incident_ptr': incident_ptr
+            }
+        return self._scoring
+    
+    def _seating_to_slots(self, seating_arrangement):
+        """{(세로줄, 가로줄): 학생} 배치를 '칸 -> 학생 번호' 순열로 바꾸기"""
+        scoring = self._prepare_scoring()
+        n_students = scoring['n_students']
+        slots = np.full(scoring['n_slots'], -1, dtype=np.intp)
+        
+        for pos, student in seating_arrangement.items():
+            seat = scoring['seat_index'].get(pos)
+            student_id = scoring['index'].get(student)
+            if seat is not None and student_id is not None:
+                slots[seat] = student_id
+        
+        # 자리에 없는 학생은 남는 칸에, 나머지 칸은 빈자리 번호로 채우기
+        missing = np.setdiff1d(np.arange(scoring['n_slots']), slots[slots >= 0])
+        slots[slots < 0] = missing[:np.count_nonzero(slots < 0)]
+        if scoring['n_slots'] > scoring['n_seats']:
+            # 못 앉은 학생이 빈자리보다 먼저 오도록 정리
+            extra = slots[scoring['n_seats']:]
+            extra.sort()
+        return slots
+    
+    def _seating_to_seat_of(self, seating_arrangement):
+        """{(세로줄, 가로줄): 학생} 배치를 '학생 -> 칸' 배열로 바꾸기 (배치에 없는 학생은 못 앉은 칸)"""
+        scoring = self._prepare_scoring()
+        seat_of = np.full(scoring['n_students'], scoring['n_slots'], dtype=np.intp)
+        
+        for pos, student in seating_arrangement.items():
+            seat = scoring['seat_index'].get(pos)
+            student_id = scoring['index'].get(student)
+            if seat is not None and student_id is not None:
+                seat_of[student_id] = seat
+        return seat_of
+    
+    def _slots_to_seating(self, slots):
+        """'칸 -> 학생 번호' 순열을 {(세로줄, 가로줄): 학생} 배치로 바꾸기"""
+        scoring = self._prepare_scoring()
+        students = scoring['students']
+        return {
+            self.seat_positions[seat]: students[student_id]
+            for seat, student_id in enumerate(slots[:scoring['n_seats']].tolist())
+            if student_id < scoring['n_students']
+        }
+    
+    def _slots_to_seat_of(self, slots):
+        """'칸 -> 학생' 순열을 '학생 -> 칸' 배열로 뒤집기 (여러 배치도 한꺼번에)"""
+        seat_of = np.empty_like(slots)
+        np.put_along_axis(seat_of, slots, np.broadcast_to(np.arange(slots.shape[-1]), slots.shape), axis=-1)
+        return seat_of[..., :self._prepare_scoring()['n_students']]
+    
+    def _pair_scores(self, edge_ids, src_seat, dst_seat):
+        """선마다 관계 점수 (좋은 관계는 가까이, 안 좋은 관계는 멀리)"""
+        scoring = self._prepare_scoring()
+        if scoring['seat_distance'] is not None:
+            distance = scoring['seat_distance'][src_seat, dst_seat]
+        else:
+            diff = scoring['coords'][src_seat] - scoring['coords'][dst_seat]
+            distance = np.sqrt((diff ** 2).sum(axis=-1))
+        
+        weight = scoring['weight'][edge_ids]
+        score = np.where(weight > 0, weight * (1 / (1 + distance)), np.abs(weight) * distance)
+        
+        # 두 학생 모두 자리에 앉아 있을 때만 계산
+        seated = (src_seat < scoring['n_seats']) & (dst_seat < scoring['n_seats'])
+        return np.where(seated, score, 0)
+    
+    def _teacher_scores(self, student_ids, seats):
+        """학생마다 선생님과의 거리에 따른 점수"""
+        scoring = self._prepare_scoring()
+        role = scoring['role'][student_ids]
+        return np.where(role > 0, scoring['helper_score'][seats],
+                        np.where(role < 0, scoring['receiver_score'][seats], 0))
+    
+    def _score_seat_of(self, seat_of):
+        """'학생 -> 칸' 배열로 점수 계산하기 (2차원이면 배치마다 점수)"""
+        scoring = self._prepare_scoring()
+        edge_ids = np.arange(len(scoring['weight']))
+        pair_total = self._pair_scores(edge_ids, seat_of[..., scoring['src']], seat_of[..., scoring['dst']]).sum(axis=-1)
+        teacher_total = self._teacher_scores(np.arange(scoring['n_students']), seat_of).sum(axis=-1)
+        return pair_total + teacher_total
+    
+    def _swap_delta(self, slots, seat_of, slot1, slot2):
+        """두 칸의 학생을 바꾸면 점수가 얼마나 변하는지 (두 학생의 선만 보기)"""
+        scoring = self._prepare_scoring()
+        moved = np.array([student for student in (slots[slot1], slots[slot2])
+                          if student < scoring['n_students']], dtype=np.intp)
+        if len(moved) == 0:
+            return 0.0
+        
+        ptr = scoring['incident_ptr']
+        edge_ids = np.concatenate([scoring['incident_edges'][ptr[s]:ptr[s + 1]] for s in moved])
+        old_src = seat_of[scoring['src'][edge_ids]]
+        old_dst = seat_of[scoring['dst'][edge_ids]]
+        
+        def swapped(seats):
+            return np.where(seats == slot1, slot2, np.where(seats == slot2, slot1, seats))
+        
+        old_seats = seat_of[moved]
+        delta = (self._pair_scores(edge_ids, swapped(old_src), swapped(old_dst)).sum()
+                 - self._pair_scores(edge_ids, old_src, old_dst).sum())
+        
+        # 두 학생 사이의 선은 양쪽 학생 목록에 모두 들어 있지만 거리가 그대로라 0이에요
+        delta += (self._teacher_scores(moved, swapped(old_seats)).sum()
+                  - self._teacher_scores(moved, old_seats).sum())
+        return float(delta)
+    
+    def calculate_swap_delta(self, seating_arrangement, student_positions, pos1, pos2):
+        """두 자리의 학생을 바꾸면 점수가 얼마나 변하는지 계산하기
+        
+        바뀌는 두 학생에게 이어진 관계만 보기 때문에 전체 점수를 다시
+        계산하는 것보다 훨씬 빨라요. student_positions는 {학생: 자리}예요.
+        """
+        if not self.graph:
+            return 0
+        
+        scoring = self._prepare_scoring()
+        return self._swap_delta(self._seating_to_slots(seating_arrangement),
+                                self._seating_to_seat_of({pos: student for student, pos in student_positions.items()}),
+                                scoring['seat_index'][pos1], scoring['seat_index'][pos2])
     
     def get_teacher_position(self):
         """선생님 위치 알려주기"""
@@ -120,89 +304,87 @@ class SeatingOptimizer:
             
         return seating
     
-    def optimize_seating_genetic(self, population_size=50, generations=100, mutation_rate=0.1):
-        """똑똑한 방법으로 자리 배치 찾기"""
+    def _crossover(self, parents1, parents2):
+        """두 배치를 섞어서 새로운 배치 만들기 (여러 쌍을 한꺼번에)
+        
+        앞쪽 절반 자리는 parent1에서 가져오고, 나머지 칸은 parent2에
+        나오는 순서대로 아직 안 쓴 학생으로 채워요.
+        """
+        n_children, n_slots = parents1.shape
+        split = len(self.seat_positions) // 2
+        
+        head = parents1[:, :split]
+        used = np.zeros((n_children, n_slots), dtype=bool)
+        np.put_along_axis(used, head, True, axis=1)
+        
+        remaining = ~np.take_along_axis(used, parents2, axis=1)
+        tail = parents2[remaining].reshape(n_children, n_slots - split)
+        return np.hstack([head, tail])
+    
+    def _mutate(self, population, mutation_rate, rng):
+        """조금씩 바꿔보기 (정해진 확률로 두 칸의 학생 바꾸기)"""
+        n_individuals, n_slots = population.shape
+        if n_slots < 2:
+            return population
+        
+        rows = np.flatnonzero(rng.random(n_individuals) < mutation_rate)
+        slot1 = rng.integers(n_slots, size=len(rows))
+        slot2 = (slot1 + rng.integers(1, n_slots, size=len(rows))) % n_slots
+        
+        students1 = population[rows, slot1]
+        population[rows, slot1] = population[rows, slot2]
+        population[rows, slot2] = students1
+        return population
+    
+    def optimize_seating_genetic(self, population_size=50, generations=100, mutation_rate=0.1, seed=None):
+        """똑똑한 방법으로 자리 배치 찾기
+        
+        배치 전체를 (배치 수 x 칸 수) 순열 배열로 두고, 점수 계산과
+        섞기/바꾸기를 한꺼번에 해요. seed를 주면 같은 결과가 나와요.
+        """
         if not self.students or not hasattr(self, 'seat_positions') or not self.seat_positions:
             return None
         
         try:
-            def create_individual():
-                """새로운 자리 배치 만들기"""
-                return self.random_seating()
-            
-            def crossover(parent1, parent2):
-                """두 배치를 섞어서 새로운 배치 만들기"""
-                child = {}
-                positions = list(self.seat_positions)
-                
-                # 절반은 parent1에서, 절반은 parent2에서
-                split_point = len(positions) // 2
-                
-                used_students = set()
-                
-                # Parent1에서 절반 가져오기
-                for i in range(split_point):
-                    pos = positions[i]
-                    if pos in parent1 and parent1[pos] not in used_students:
-                        child[pos] = parent1[pos]
-                        used_students.add(parent1[pos])
-                
-                # Parent2에서 나머지 채우기
-                remaining_positions = [pos for pos in positions if pos not in child]
-                remaining_students = [s for s in self.students if s not in used_students]
-                
-                for pos in remaining_positions:
-                    if remaining_students:
-                        student = remaining_students.pop(0)
-                        child[pos] = student
-                
-                return child
-            
-            def mutate(individual):
-                """조금씩 바꿔보기"""
-                if random.random() < mutation_rate:
-                    # 두 학생의 자리를 바꿈
-                    positions = list(individual.keys())
-                    if len(positions) >= 2:
-                        pos1, pos2 = random.sample(positions, 2)
-                        individual[pos1], individual[pos2] = individual[pos2], individual[pos1]
-                return individual
+            rng = np.random.default_rng(seed)
+            n_slots = self._prepare_scoring()['n_slots']
+            elite_size = max(2, population_size // 2)
+            population_size = max(population_size, elite_size)
             
             # 처음 배치들 만들기
-            population = [create_individual() for _ in range(population_size)]
+            population = rng.permuted(np.tile(np.arange(n_slots), (population_size, 1)), axis=1)
             
             best_individual = None
             best_score = float('-inf')
             
             for generation in range(generations):
                 # 점수 계산하기
-                scores = [(individual, self.calculate_seating_score(individual)) 
-                         for individual in population]
-                scores.sort(key=lambda x: x[1], reverse=True)
+                scores = self._score_seat_of(self._slots_to_seat_of(population))
+                ranking = np.argsort(-scores, kind='stable')
                 
                 # 가장 좋은 배치 업데이트
-                if scores[0][1] > best_score:
-                    best_score = scores[0][1]
-                    best_individual = scores[0][0].copy()
+                if scores[ranking[0]] > best_score:
+                    best_score = float(scores[ranking[0]])
+                    best_individual = population[ranking[0]].copy()
                 
                 # 좋은 배치들 골라내기 (상위 50% 유지)
-                elite_size = population_size // 2
-                elite = [individual for individual, score in scores[:elite_size]]
-                
-                # 새로운 배치들 만들기
-                new_population = elite.copy()
+                elite = population[ranking[:elite_size]]
                 
-                # 섞기와 바꾸기로 나머지 채우기
-                while len(new_population) < population_size:
-                    parent1, parent2 = random.sample(elite, 2)
-                    child = crossover(parent1, parent2)
-                    child = mutate(child)
-                    new_population.append(child)
+                # 섞기와 바꾸기로 나머지 채우기 (서로 다른 두 부모)
+                n_children = population_size - elite_size
+                parent1 = rng.integers(elite_size, size=n_children)
+                parent2 = (parent1 + rng.integers(1, elite_size, size=n_children)) % elite_size
+                children = self._mutate(self._crossover(elite[parent1], elite[parent2]), mutation_rate, rng)
                 
-                population = new_population
+                population = np.vstack([elite, children])
+            
+            if best_individual is None:
+                best_individual = population[0]
+                best_score = float(self._score_seat_of(self._slots_to_seat_of(best_individual)))
             
-            self.current_seating = best_individual
-            return best_individual, best_score
+            best_seating = self._slots_to_seating(best_individual)
+            self.current_seating = best_seating
+            return best_seating, best_score
             
         except Exception as e:
             # 오류 발생 시 간단한 무작위 배치 반환
@@ -211,8 +393,14 @@ class SeatingOptimizer:
             self.current_seating = seating
             return seating, score
     
-    def optimize_seating_greedy(self):
-        """빠른 방법으로 자리 배치 찾기"""
+    def optimize_seating_greedy(self, max_swaps=None, seed=None):
+        """빠른 방법으로 자리 배치 찾기
+        
+        max_swaps: 바꿔볼 횟수 (기본값은 학생 수 x 2, 최대 50번)
+        seed: 주면 같은 결과가 나와요
+        """
+        rng = random if seed is None else random.Random(seed)
+        
         if not self.students or not self.seat_positions:
             return None
         
@@ -222,7 +410,7 @@ class SeatingOptimizer:
             remaining_positions = self.seat_positions.copy()
             
             # 간단하게 무작위 배치로 시작
-            random.shuffle(remaining_students)
+            rng.shuffle(remaining_students)
             
             # 학생들을 순서대로 배치
             for i, student in enumerate(remaining_students):
@@ -230,24 +418,30 @@ class SeatingOptimizer:
                     position = remaining_positions[i]
                     seating[position] = student
             
-            # 최적화: 몇 번 학생들 위치 바꿔보기
-            for _ in range(min(50, len(self.students) * 2)):
+            if max_swaps is None:
+                max_swaps = min(50, len(self.students) * 2)
+            
+            if not self.graph:
+                self.current_seating = seating
+                return seating
+            
+            # 최적화: 몇 번 학생들 위치 바꿔보기 (바뀌는 점수만 계산)
+            slots = self._seating_to_slots(seating)
+            seat_of = self._slots_to_seat_of(slots)
+            n_students = self._prepare_scoring()['n_students']
+            positions = [seat for seat in range(len(self.seat_positions)) if slots[seat] < n_students]
+            for _ in range(max_swaps):
                 # 무작위로 두 학생 선택
-                positions = list(seating.keys())
                 if len(positions) >= 2:
-                    pos1, pos2 = random.sample(positions, 2)
-                    
-                    # 원래 점수
-                    original_score = self.calculate_seating_score(seating)
-                    
-                    # 위치 바꿔보기
-                    seating[pos1], seating[pos2] = seating[pos2], seating[pos1]
-                    new_score = self.calculate_seating_score(seating)
+                    seat1, seat2 = rng.sample(positions, 2)
                     
-                    # 점수가 나빠지면 원래대로
-                    if new_score < original_score:
-                        seating[pos1], seating[pos2] = seating[pos2], seating[pos1]
+                    # 점수가 나빠지지 않으면 위치 바꾸기
+                    if self._swap_delta(slots, seat_of, seat1, seat2) >= -SCORE_TOLERANCE:
+                        slots[seat1], slots[seat2] = slots[seat2], slots[seat1]
+                        seat_of[slots[seat1]] = seat1
+                        seat_of[slots[seat2]] = seat2
             
+            seating = self._slots_to_seating(slots)
             self.current_seating = seating
             return seating
             
@@ -257,6 +451,141 @@ class SeatingOptimizer:
             self.current_seating = seating
             return seating
     
+    def optimize_seating_annealing(self, time_budget_ms=500, seed=None, max_iterations=None,
+                                   start_temperature=None, cooling=1e-3):
+        """담금질 방법으로 정해진 시간 안에 자리 배치 찾기
+        
+        두 자리를 바꿔 보면서, 처음에는 점수가 조금 나빠지는 바꾸기도 받아들이고
+        온도가 내려갈수록 덜 받아들여요. 시간이 다 되면 그때까지 찾은 가장 좋은
+        배치를 돌려줘요.
+        
+        time_budget_ms: 찾는 시간 (밀리초)
+        seed: 같으면 바꿔 보는 순서가 같아요
+        max_iterations: 주면 온도를 바꾼 횟수에 맞춰 내려서, 시간 안에 끝나면
+            결과가 항상 같아요 (없으면 흐른 시간에 맞춰 내려요)
+        start_temperature: 처음 온도 (없으면 무작위 바꾸기로 정해요)
+        cooling: 마지막 온도 / 처음 온도
+        """
+        if not self.students or not hasattr(self, 'seat_positions') or not self.seat_positions:
+            return None
+        
+        start = time.perf_counter()
+        deadline = start + time_budget_ms / 1000
+        rng = random.Random(seed)
+        
+        scoring = self._prepare_scoring()
+        n_seats, n_slots = scoring['n_seats'], scoring['n_slots']
+        slots = np.array(rng.sample(range(n_slots), n_slots), dtype=np.intp)
+        seat_of = np.argsort(slots)  # 빈자리 번호까지 포함한 '번호 -> 칸'
+        
+        def random_move():
+            # 첫 번째 칸은 항상 자리 (못 앉은 칸끼리 바꾸는 일은 없게)
+            slot1 = rng.randrange(n_seats)
+            slot2 = rng.randrange(n_slots - 1)
+            return slot1, slot2 + (slot2 >= slot1)
+        
+        if n_slots < 2 or not self.graph:
+            seating = self._slots_to_seating(slots)
+            self.current_seating = seating
+            return seating, self.calculate_seating_score(seating)
+        
+        if start_temperature is None:
+            # 무작위 바꾸기로 점수가 얼마나 변하는지 보고 처음 온도 정하기
+            changes = [abs(self._swap_delta(slots, seat_of, *random_move())) for _ in range(min(50, n_slots))]
+            start_temperature = (sum(changes) / len(changes)) or 1.0
+        
+        current_score = float(self._score_seat_of(seat_of[:scoring['n_students']]))
+        best_score = current_score
+        best_slots = slots.copy()
+        
+        iteration = 0
+        while max_iterations is None or iteration < max_iterations:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            
+            if max_iterations is None:
+                progress = (now - start) / (deadline - start)
+            else:
+                progress = iteration / max_iterations
+            temperature = start_temperature * cooling ** progress
+            iteration += 1
+            
+            slot1, slot2 = random_move()
+            delta = self._swap_delta(slots, seat_of, slot1, slot2)
+            if delta >= 0 or rng.random() < math.exp(delta / temperature):
+                student1, student2 = slots[slot1], slots[slot2]
+                slots[slot1], slots[slot2] = student2, student1
+                seat_of[student1], seat_of[student2] = slot2, slot1
+                current_score += delta
+                
+                if current_score > best_score + SCORE_TOLERANCE:
+                    best_score = current_score
+                    best_slots = slots.copy()
+        
+        best_seating = self._slots_to_seating(best_slots)
+        self.current_seating = best_seating
+        return best_seating, self.calculate_seating_score(best_seating)
+    
+    def _search_once(self, method, seed, options):
+        """정해진 방법과 시작점으로 자리 배치 한 번 찾기 -> (배치, 점수)"""
+        if method == 'genetic':
+            return self.optimize_seating_genetic(seed=seed, **options)
+        if method == 'greedy':
+            seating = self.optimize_seating_greedy(seed=seed, **options)
+            return seating, self.calculate_seating_score(seating)
+        if method == 'annealing':
+            return self.optimize_seating_annealing(seed=seed, **options)
+        raise ValueError(f"알 수 없는 배치 방법이에요: {method}")
+    
+    def optimize_seating_parallel(self, restarts=8, workers=None, method='genetic', seed=None, **options):
+        """여러 시작점에서 동시에 자리 배치를 찾고 가장 좋은 배치 고르기
+        
+        restarts: 시작점 수 (시작점마다 seed + 번호를 씨앗으로 사용)
+        workers: 동시에 돌릴 프로세스 수 (기본값은 CPU 수, 1이면 지금 프로세스에서)
+        method: 'genetic', 'greedy', 'annealing' 중 하나, options는 그 방법에 그대로 전달
+        
+        (가장 좋은 배치, 점수, 시작점별 [{'seed', 'score', 'seconds'}]) 를 돌려줘요.
+        """
+        if restarts < 1:
+            raise ValueError(f"시작점 수는 1 이상이어야 해요: {restarts}")
+        if method not in SEARCH_METHODS:
+            raise ValueError(f"알 수 없는 배치 방법이에요: {method}")
+        if not self.students or not hasattr(self, 'seat_positions') or not self.seat_positions:
+            return None
+        
+        if seed is None:
+            seed = random.randrange(2 ** 31)
+        seeds = [seed + i for i in range(restarts)]
+        workers = min(workers or os.cpu_count() or 1, restarts)
+        
+        results = []
+        if workers <= 1:
+            for run_seed in seeds:
+                start = time.perf_counter()
+                seating, score = self._search_once(method, run_seed, options)
+                results.append((seating, score, time.perf_counter() - start))
+        else:
+            # 그래프는 프로세스마다 한 번만 (학생 목록 + 선 목록으로) 보내기
+            initargs = (
+                list(self.graph.nodes()),
+                list(self.graph.edges(data='weight', default=1)),
+                self.classroom_layout['rows'],
+                self.classroom_layout['cols'],
+                self.classroom_layout['teacher_position']
+            )
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_search_worker,
+                                     initargs=initargs) as executor:
+                futures = [executor.submit(_run_search, method, run_seed, options) for run_seed in seeds]
+                results = [future.result() for future in futures]
+        
+        runs = [{'seed': run_seed, 'score': score, 'seconds': seconds}
+                for run_seed, (_, score, seconds) in zip(seeds, results)]
+        best_seating, best_score, _ = max(results, key=lambda result: result[1])
+        
+        self.current_seating = best_seating
+        return best_seating, best_score, runs
+    
     def create_seating_visualization(self, seating_arrangement=None):
         """자리 배치를 그림으로 보여주기"""
         if seating_arrangement is None:
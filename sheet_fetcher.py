@@ -0,0 +1,160 @@
+"""구글시트 CSV 가져오기 (연결 재사용, 바뀐 것만 받기, 디스크 저장)
+
+같은 시트를 여러 번 가져올 때는 ETag / Last-Modified로 "바뀌었나요?"만 물어봐서
+바뀌지 않았으면 304 응답 한 번으로 끝나요. 받은 내용은 파일 ID별로 디스크에 저장하고,
+내용 해시가 그대로면 changed=False로 알려줘서 다시 분석하지 않아도 되게 해요.
+
+테스트할 때는 SHEETS_BASE_URL 환경 변수(또는 base_url)로 로컬 서버 주소를 쓰면 돼요.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_BASE_URL = os.environ.get('SHEETS_BASE_URL', 'https://docs.google.com/spreadsheets')
+DEFAULT_CACHE_DIR = os.environ.get(
+    'SHEETS_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'friendship_analyzer_sheets')
+)
+DEFAULT_TIMEOUT = 10  # 초
+POOL_SIZE = 10
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def extract_file_id(url):
+    """구글시트 URL에서 파일 ID 추출"""
+    patterns = [
+        r'/spreadsheets/d/([a-zA-Z0-9-_]+)',
+        r'id=([a-zA-Z0-9-_]+)',
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, url)
+        if match:
+            return match.group(1)
+    return None
+
+
+def get_session():
+    """모든 요청이 같이 쓰는 연결 풀 (처음 부를 때 만들기)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session
+
+
+class SheetFetcher:
+    """구글시트 CSV를 조건부 요청과 디스크 저장으로 가져오기"""
+
+    def __init__(self, base_url=None, cache_dir=None, timeout=DEFAULT_TIMEOUT, session=None):
+        self.base_url = (base_url or DEFAULT_BASE_URL).rstrip('/')
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.timeout = timeout
+        self.session = session
+        # 파일 ID마다 잠금 하나 (다른 시트를 가져오는 사용자끼리는 기다리지 않게)
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    def csv_url(self, file_id):
+        return f"{self.base_url}/d/{file_id}/export?format=csv"
+
+    def _cache_paths(self, file_id):
+        return (os.path.join(self.cache_dir, f"{file_id}.csv"),
+                os.path.join(self.cache_dir, f"{file_id}.json"))
+
+    def _file_lock(self, file_id):
+        with self._locks_lock:
+            return self._locks.setdefault(file_id, threading.Lock())
+
+    def _read_cache(self, file_id):
+        """저장해 둔 (내용, 정보) 읽기 (없으면 (None, {}))"""
+        content_path, meta_path = self._cache_paths(file_id)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(content_path, 'rb') as f:
+                content = f.read()
+        except (OSError, ValueError):
+            return None, {}
+        if hashlib.sha1(content).hexdigest() != meta.get('content_hash'):
+            # 저장하다 멈춘 파일은 없는 것으로 보기
+            return None, {}
+        return content, meta
+
+    def _write_cache(self, file_id, meta, content=None):
+        """내용을 먼저, 정보를 나중에 (이름 바꾸기로) 저장하기 (content가 None이면 정보만)"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        content_path, meta_path = self._cache_paths(file_id)
+        files = [(meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))]
+        if content is not None:
+            files.insert(0, (content_path, content))
+        for path, data in files:
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+
+    def fetch(self, url_or_id):
+        """시트 CSV 가져오기
+
+        {'file_id', 'content'(bytes), 'content_hash', 'changed', 'status'} 를 돌려줘요.
+        status는 받은 HTTP 상태(200, 304)예요. changed는 지난번에 받은 내용과 다를 때 True예요.
+        """
+        file_id = extract_file_id(url_or_id) or url_or_id
+        if not re.fullmatch(r'[a-zA-Z0-9-_]+', file_id or ''):
+            raise ValueError("올바른 구글시트 주소가 아니에요.")
+
+        with self._file_lock(file_id):
+            cached, meta = self._read_cache(file_id)
+
+            headers = {}
+            if cached is not None:
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
+
+            session = self.session or get_session()
+            response = session.get(self.csv_url(file_id), headers=headers, timeout=self.timeout)
+
+            if response.status_code == 304 and cached is not None:
+                meta['checked_at'] = time.time()
+                self._write_cache(file_id, meta)
+                return {'file_id': file_id, 'content': cached, 'content_hash': meta['content_hash'],
+                        'changed': False, 'status': 304}
+
+            response.raise_for_status()
+            content = response.content
+            content_hash = hashlib.sha1(content).hexdigest()
+            changed = content_hash != meta.get('content_hash')
+            self._write_cache(file_id, {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'content_hash': content_hash,
+                'checked_at': time.time(),
+            }, content)
+            return {'file_id': file_id, 'content': content, 'content_hash': content_hash,
+                    'changed': changed, 'status': response.status_code}
+
+
+_default_fetcher = None
+
+
+def fetch_sheet(url_or_id):
+    """기본 설정(SHEETS_BASE_URL, SHEETS_CACHE_DIR)으로 시트 CSV 가져오기"""
+    global _default_fetcher
+    if _default_fetcher is None:
+        _default_fetcher = SheetFetcher()
+    return _default_fetcher.fetch(url_or_id)